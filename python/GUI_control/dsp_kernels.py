@@ -0,0 +1,146 @@
+# ─── dsp_kernels.py ──────────────────────────────────────────────
+"""
+Fused numeric kernels for the packet decoder and per-frame PSD pipeline.
+
+The steps around the FFT (window multiply, |X|, scaling and 20·log10),
+the max-hold accumulation and the timestamp Δt trace are each one or
+more full passes over memory in NumPy, and the reader's packet decode
+was a Python loop per frame. When Numba is installed they
+are compiled into single-pass loops; otherwise the same functions fall
+back to vectorised NumPy so results are identical either way.
+
+The kernels are deliberately not parallel=True: they run on the plot
+DSP thread and in the reader process, where 16 × ~257 bins are too
+small to split across threads and extra worker threads would only
+oversubscribe the CPU alongside the Tk and DSP threads.
+
+- Numba is optional (pip install numba)
+- warmup() compiles the kernels ahead of the first frame
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # NumPy fallback
+
+HAVE_NUMBA = njit is not None
+
+_EPS = 1e-20  # keeps log10 finite for empty bins
+
+
+if HAVE_NUMBA:
+    @njit(fastmath=True, cache=True)
+    def apply_window(seg, win, out):
+        """out[ch, i] = seg[ch, i] * win[i]  for channel-major (ch, N) data"""
+        n_ch, n = seg.shape
+        for ch in range(n_ch):
+            for i in range(n):
+                out[ch, i] = seg[ch, i] * win[i]
+
+    @njit(fastmath=True, cache=True)
+    def mag_to_db(spec, scale, out):
+        """out = 20·log10(|spec|·scale + eps), one pass over the spectrum."""
+        rows, cols = spec.shape
+        for r in range(rows):
+            for k in range(cols):
+                re = spec[r, k].real
+                im = spec[r, k].imag
+                out[r, k] = 20.0 * np.log10(np.sqrt(re * re + im * im) * scale + _EPS)
+
+    @njit(fastmath=True, cache=True)
+    def maxhold(psd, acc, mask):
+        """acc[ch] = max(acc[ch], psd[ch]) for every channel with mask[ch]."""
+        rows, cols = psd.shape
+        for r in range(rows):
+            if mask[r]:
+                for k in range(cols):
+                    if psd[r, k] > acc[r, k]:
+                        acc[r, k] = psd[r, k]
+
+    @njit(cache=True)
+    def decode_frames(raw, n_frames, frame_size, scale, data, time, ptr):
+        """
+        Decode *n_frames* frames of *raw* (uint8) into ring columns from
+        *ptr* on and return the advanced ptr. A frame is 16 big-endian
+        24-bit samples followed by a little-endian uint32 timestamp.
+        """
+        n_ch = data.shape[0]
+        length = data.shape[1]
+        for f in range(n_frames):
+            base = f * frame_size
+            for ch in range(n_ch):
+                o = base + 3 * ch
+                v = (np.int32(raw[o]) << 16) | (np.int32(raw[o + 1]) << 8) | np.int32(raw[o + 2])
+                if v & 0x800000:
+                    v -= 0x1000000
+                data[ch, ptr] = v * scale
+            o = base + 3 * n_ch
+            time[ptr] = (np.uint32(raw[o]) | (np.uint32(raw[o + 1]) << 8) |
+                         (np.uint32(raw[o + 2]) << 16) | (np.uint32(raw[o + 3]) << 24))
+            ptr += 1
+            if ptr == length:
+                ptr = 0
+        return ptr
+
+    @njit(fastmath=True, cache=True)
+    def timestamp_dt(ts, out):
+        """out[i] = (ts[i+1] - ts[i]) · 8 µs for 32-bit 8 µs tick counters."""
+        for i in range(out.size):
+            out[i] = np.uint32(ts[i + 1] - ts[i]) * 8.0
+
+else:
+    def apply_window(seg, win, out):
+        """out[ch, i] = seg[ch, i] * win[i]  for channel-major (ch, N) data"""
+        np.multiply(seg, win, out=out)
+
+    def mag_to_db(spec, scale, out):
+        """out = 20·log10(|spec|·scale + eps), computed in place in *out*."""
+        np.abs(spec, out=out)
+        out *= scale
+        out += _EPS
+        np.log10(out, out=out)
+        out *= 20
+
+    def maxhold(psd, acc, mask):
+        """acc[ch] = max(acc[ch], psd[ch]) for every channel with mask[ch]."""
+        np.maximum(psd, acc, out=acc, where=mask[:, None])
+
+    def decode_frames(raw, n_frames, frame_size, scale, data, time, ptr):
+        """
+        Decode *n_frames* frames of *raw* (uint8) into ring columns from
+        *ptr* on and return the advanced ptr. A frame is 16 big-endian
+        24-bit samples followed by a little-endian uint32 timestamp.
+        """
+        n_ch = data.shape[0]
+        frames = raw[:n_frames * frame_size].reshape(n_frames, frame_size)
+        b = frames[:, :3 * n_ch].reshape(n_frames, n_ch, 3).astype(np.int32)
+        v = b[:, :, 0] << 16 | b[:, :, 1] << 8 | b[:, :, 2]
+        v -= (v & 0x800000) << 1  # sign-extend 24 → 32 bit
+        cols = (ptr + np.arange(n_frames)) % data.shape[1]
+        data[:, cols] = (v * scale).T
+        time[cols] = frames[:, 3 * n_ch:3 * n_ch + 4].copy().view('<u4').ravel()
+        return (ptr + n_frames) % data.shape[1]
+
+    def timestamp_dt(ts, out):
+        """out[i] = (ts[i+1] - ts[i]) · 8 µs for 32-bit 8 µs tick counters."""
+        # uint32 subtraction wraps with the counter
+        np.subtract(ts[1:], ts[:-1], out=out, dtype=np.uint32, casting="unsafe")
+        out *= 8.0
+
+
+def warmup():
+    """Compile (or load from cache) the kernels for the PSD dtypes."""
+    if not HAVE_NUMBA:
+        return
+    data = np.zeros((2, 8), dtype=np.float32)
+    win = np.ones(4, dtype=np.float32)
+    apply_window(data[:, -4:], win, np.empty((2, 4), dtype=np.float32))
+    spec = np.zeros((2, 5), dtype=np.complex64)
+    mag_to_db(spec, 0.125, np.empty((2, 5), dtype=np.float32))
+    maxhold(np.zeros((2, 5), dtype=np.float32), np.zeros((2, 5), dtype=np.float32),
+            np.ones(2, dtype=np.bool_))
+    timestamp_dt(np.zeros(3, dtype=np.uint32), np.empty(2, dtype=np.float32))
+    decode_frames(np.zeros(52, dtype=np.uint8), 1, 52, 1.0,
+                  np.empty((16, 2), dtype=np.float32), np.empty(2, dtype=np.uint32), 0)
@@ -49,13 +49,13 @@ import queue
 import threading
 import time
 import random
-import socket
 import numpy as np
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, font
 from serial_backend import SerialManager
 from udp_backend import UDPManager
+from message_queue import MessageQueue
 from signal_backend import SignalWorker, SigConfig
 from plot_manager import PlotManager  # NEW: Import PlotManager
 
@@ -70,8 +70,43 @@ class WiFiWorker(threading.Thread):
         super().__init__(daemon=True); self.q, self.stop_evt = q, stop_evt
     def run(self):
         cnt = 0
+        while not self.stop_evt.wait(2.0):  # returns at once on shutdown
+            self.q.put(f"[Wi‑Fi DEMO] Tick {cnt}\n"); cnt += 1
+
+class PortScanner(threading.Thread):
+    """Re-enumerate COM ports off the Tk thread (a scan can take tens of ms
+    on Windows) and queue (ports, error) only on change. Scans when asked
+    via rescan() - i.e. when the user reaches for the port list - and
+    otherwise every *period* s to notice plugged/unplugged boards, backing
+    off to *max_period* once *backoff_after* scans in a row found nothing
+    new (a change or a rescan() request goes back to *period*)."""
+    def __init__(self, q, stop_evt, period=2.0, max_period=5.0, backoff_after=5):
+        super().__init__(daemon=True, name="PortScan")
+        self.q, self.stop_evt = q, stop_evt
+        self.period, self.max_period, self.backoff_after = period, max_period, backoff_after
+        self._wake = threading.Event()
+    def rescan(self):
+        self._wake.set()
+    def run(self):
+        last = None
+        unchanged = 0
+        fresh = True   # first scan and rescan() requests bypass the port cache
         while not self.stop_evt.is_set():
-            self.q.put(f"[Wi‑Fi DEMO] Tick {cnt}\n"); cnt += 1; time.sleep(2)
+            try:
+                result = (sorted(SerialManager.ports(fresh=fresh)), None)
+            except Exception as e:                 # catch any PySerial/WMI error
+                result = ([], str(e))
+            if result != last:
+                last = result
+                self.q.put(result)
+                unchanged = 0
+            else:
+                unchanged += 1
+            wait = self.period if unchanged < self.backoff_after else self.max_period
+            fresh = self._wake.wait(wait)
+            if fresh:
+                unchanged = 0
+            self._wake.clear()
 
 # ─────────────────────────── Main GUI ─────────────────────────
 class App(tk.Tk):
@@ -85,12 +120,22 @@ class App(tk.Tk):
     BORDER_COLOR = "#FFB000"    # Amber borders
     BORDER_ACTIVE = "#FF6B00"   # Orange borders when active
     
+    # ttk button styles for two-way selectors
+    PLAIN_BTN = "TButton"
+    ACTIVE_BTN = "Active.TButton"
+    
     # Console colors
     CONSOLE_BG = "#000000"
     SERIAL_FG = "#00FF00"       # Green terminal style
     WIFI_FG = "#FFB000"         # Amber for WiFi console
     
-    RESIZE_DELAY_MS = 40  # draw 40 ms after last Configure → instant feel
+    RESIZE_DELAY_MS = 40  # at most one resize redraw per 40 ms (leading + trailing)
+    SLIDER_DELAY_MS = 60  # apply slider settings 60 ms after the drag stops
+    FRAME_MS = 16         # animation frame period (~60 fps)
+    IDLE_POLL_MS = 25     # animation re-check period while not streaming
+    
+    DRAIN_MAX_CHARS = 64 * 1024   # max console text inserted per poll tick
+    CONSOLE_MAX_LINES = 5000      # older console lines are discarded
 
     def __init__(self):
         super().__init__()
@@ -108,8 +153,13 @@ class App(tk.Tk):
         self.setup_fonts()
         self._apply_style()
 
-        # debouncer handle
+        # debouncer handles
         self._resize_job = None
+        self._last_draw_t = 0.0  # monotonic time of the last resize redraw
+        self._after_jobs = {}  # _debounce key -> pending after() id
+        
+        # (snapshot seq, plot settings) last handed to PlotManager
+        self._last_plot_key = None
 
         # master grid 1×3 : 2:1:1
         self.rowconfigure(0, weight=1)
@@ -118,7 +168,8 @@ class App(tk.Tk):
 
         # queues & stop‑event
         self.stop_evt = threading.Event()
-        self.wifi_q = queue.Queue()
+        self.wifi_q = MessageQueue()  # demo ticks, UDP status + board replies
+        self.port_q = queue.Queue()   # PortScanner → (ports, error) on change
 
         # Create serial manager early
         self.ser = SerialManager()
@@ -131,7 +182,9 @@ class App(tk.Tk):
         # ------- Signal backend (now safe because fs_var & dur_var exist) --------
         self.sig_cfg = SigConfig(sample_rate=int(self.fs_var.get()),
                                  buf_secs   =int(self.dur_var.get()),
-                                 n_ch       =16)
+                                 n_ch       =16,
+                                 fft_pts    =self._nfft,
+                                 cheb_atten_db=self._cheb_db)
         self.sig     = SignalWorker(self.sig_cfg,
                                     data_port=int(self.data_port_var.get()))
         self.sig.start()
@@ -145,7 +198,8 @@ class App(tk.Tk):
                                    font=self.mono_font)
 
         # timers
-        self.after(16, self._animate_plots)   # 60 fps animation
+        self._frame_deadline = 0.0  # see _next_frame
+        self._anim_job = self.after(self.FRAME_MS, self._animate_plots)
         self.after(50, self._poll_queues)
         
     def setup_fonts(self):
@@ -286,7 +340,14 @@ class App(tk.Tk):
         self._create_label(ctrl, "AMPLITUDE", r, 0)
         self.amp_var = tk.DoubleVar(value=0.5)
         
-        # Create log scale slider
+        # Create log scale slider. Its 0.01 steps from -6 to 0.7 are a fixed
+        # grid, so volts and label text are looked up instead of computed
+        # on every motion event
+        self._amp_lut = {}
+        for k in range(671):
+            log_val = round(k * 0.01 - 6, 2)
+            volts = 10 ** log_val
+            self._amp_lut[log_val] = (volts, self._format_volts(volts))
         self.amp_log_var = tk.DoubleVar(value=np.log10(0.5))
         self.amp_scale = self._create_nerv_scale(
             ctrl, from_=0.7, to=-6, resolution=0.01,
@@ -314,21 +375,27 @@ class App(tk.Tk):
         initial_max = initial_fs * initial_dur
         self.nfft_sld = self._create_nerv_scale(
             ctrl, from_=32, to=initial_max, variable=self.nfft_var,
-            orient="horizontal",
-            command=lambda v: (self.nfft_var.set(int(float(v))),
-                               self._sig_update(fft_pts=int(float(v)))))
+            orient="horizontal")
         self.nfft_sld.grid(row=r, column=1, columnspan=3, sticky="we", padx=2)
         self.nfft_label = self._create_label(ctrl, "512", r, 4, sticky="w")
         
         # Update label when slider moves
         def update_nfft_label(v):
             val = int(float(v))
-            self.nfft_var.set(val)
+            # Tk runs a Scale's command at idle time after *any* value
+            # change, including our own clamping in _sig_update; those
+            # already updated self._nfft, so don't feed them back
+            if val == self._nfft:
+                return
+            self._nfft = val
             self.nfft_label.config(text=str(val))
             # Only call _sig_update if sig_cfg exists
             if hasattr(self, 'sig_cfg'):
-                self._sig_update(fft_pts=val)
+                self._debounce("nfft", self.SLIDER_DELAY_MS,
+                               lambda: self._sig_update(fft_pts=val))
         self.nfft_sld.config(command=update_nfft_label)
+        self._nfft = 512
+        self._nfft_max = initial_max  # current upper limit of nfft_sld
         self.nfft_sld.set(512)
         r += 1
     
@@ -338,12 +405,16 @@ class App(tk.Tk):
         self.cheb_scale = self._create_nerv_scale(
             ctrl, from_=40, to=120, orient="horizontal",
             variable=self.cheb_var,
-            command=lambda v: (self.cheb_var.set(float(v)),
-                               self._sig_update(cheb_atten_db=float(v)))
+            command=lambda v: (setattr(self, "_cheb_db", float(v)),
+                               self._debounce("cheb", self.SLIDER_DELAY_MS,
+                                   lambda: self._sig_update(cheb_atten_db=float(v))))
         )
         self.cheb_scale.grid(row=r, column=1, columnspan=3, sticky="we", padx=2)
         self.cheb_scale.set(80.0)
+        self._cheb_db = 80.0
         self.cheb_entry = self._create_entry(ctrl, self.cheb_var, r, 4, width=6)
+        self.cheb_entry.bind('<Return>', self._update_cheb_from_entry)
+        self.cheb_entry.bind('<FocusOut>', self._update_cheb_from_entry)
         self._create_label(ctrl, "DB", r, 5, sticky="w")
         r += 1
     
@@ -353,8 +424,8 @@ class App(tk.Tk):
         self.psd_lo_scale = self._create_nerv_scale(
             ctrl, from_=-200, to=40, orient="horizontal",
             variable=self.psd_lo,
-            command=lambda v: (self.psd_lo.set(float(v)),
-                               self._enforce_psd(lo=True))
+            command=lambda v: self._debounce("psd_lo", self.SLIDER_DELAY_MS,
+                                             lambda: self._enforce_psd(lo=True))
         )
         self.psd_lo_scale.grid(row=r, column=1, sticky="we", padx=2)
         self.psd_lo_scale.set(-150)
@@ -367,8 +438,8 @@ class App(tk.Tk):
         self.psd_hi_scale = self._create_nerv_scale(
             ctrl, from_=-200, to=40, orient="horizontal",
             variable=self.psd_hi,
-            command=lambda v: (self.psd_hi.set(float(v)),
-                               self._enforce_psd(lo=False))
+            command=lambda v: self._debounce("psd_hi", self.SLIDER_DELAY_MS,
+                                             lambda: self._enforce_psd(lo=False))
         )
         self.psd_hi_scale.grid(row=r, column=4, sticky="we", padx=2)
         self.psd_hi_scale.set(-20)
@@ -390,17 +461,15 @@ class App(tk.Tk):
         ch_frame = ttk.Frame(ctrl)
         ch_frame.grid(row=r, column=1, columnspan=6, sticky="w", padx=2)
         
-        # Create 16 checkboxes in 8x2 grid
-        self.channel_vars = []
+        # Create 16 checkboxes in 8x2 grid; their state lives in one
+        # bitmask (bit i = channel i visible) instead of 16 BooleanVars
+        self.channel_mask = 0xFFFF
         self.channel_cbs = []
         
         if DEBUG:
             print(f"[MAIN_GUI] Creating channel checkboxes...")
         
         for i in range(16):
-            var = tk.BooleanVar(value=True)
-            self.channel_vars.append(var)
-        
             def make_callback(index):
                 return lambda: self._toggle_channel(index)
         
@@ -410,11 +479,12 @@ class App(tk.Tk):
                 command=make_callback(i),
                 width=3
             )
+            cb.select()
             cb.grid(row=i // 8, column=i % 8, padx=1, pady=1)
             self.channel_cbs.append(cb)
         
             if DEBUG:
-                print(f"[MAIN_GUI] Created checkbox for channel {i}, var={var.get()}")
+                print(f"[MAIN_GUI] Created checkbox for channel {i}")
             
         # Add All/None buttons
         btn_frame = ttk.Frame(ch_frame)
@@ -450,11 +520,12 @@ class App(tk.Tk):
         self.spec_win_sld = self._create_nerv_scale(
             ctrl, from_=32, to=initial_max_win, variable=self.spec_win_var,
             orient="horizontal",
-            command=lambda v: (self.spec_win_var.set(int(float(v))),
+            command=lambda v: (setattr(self, "_spec_nperseg", int(float(v))),
                                self.spec_win_label.config(text=str(int(float(v)))))
         )
         self.spec_win_sld.grid(row=r, column=3, columnspan=2, sticky="we", padx=2)
         self.spec_win_sld.set(256)
+        self._spec_nperseg = 256
         self.spec_win_label = self._create_label(ctrl, "256", r, 5, sticky="w")
         r += 1
 
@@ -464,8 +535,7 @@ class App(tk.Tk):
         self.wav_lo_scale = self._create_nerv_scale(
             ctrl, from_=-200, to=20, orient="horizontal",
             variable=self.wav_lo,
-            command=lambda v: (self.wav_lo.set(float(v)),
-                               self._enforce_wav_limits(lo=True))
+            command=lambda v: self._enforce_wav_limits(lo=True)
         )
         self.wav_lo_scale.grid(row=r, column=1, sticky="we", padx=2)
         self.wav_lo_scale.set(-120)
@@ -476,8 +546,7 @@ class App(tk.Tk):
         self.wav_hi_scale = self._create_nerv_scale(
             ctrl, from_=-200, to=20, orient="horizontal",
             variable=self.wav_hi,
-            command=lambda v: (self.wav_hi.set(float(v)),
-                               self._enforce_wav_limits(lo=False))
+            command=lambda v: self._enforce_wav_limits(lo=False)
         )
         self.wav_hi_scale.grid(row=r, column=4, sticky="we", padx=2)
         self.wav_hi_scale.set(-30)
@@ -490,8 +559,7 @@ class App(tk.Tk):
         self.spec_lo_scale = self._create_nerv_scale(
             ctrl, from_=-200, to=20, orient="horizontal",
             variable=self.spec_lo,
-            command=lambda v: (self.spec_lo.set(float(v)),
-                               self._enforce_spec_limits(lo=True))
+            command=lambda v: self._enforce_spec_limits(lo=True)
         )
         self.spec_lo_scale.grid(row=r, column=1, sticky="we", padx=2)
         self.spec_lo_scale.set(-120)
@@ -502,8 +570,7 @@ class App(tk.Tk):
         self.spec_hi_scale = self._create_nerv_scale(
             ctrl, from_=-200, to=20, orient="horizontal",
             variable=self.spec_hi,
-            command=lambda v: (self.spec_hi.set(float(v)),
-                               self._enforce_spec_limits(lo=False))
+            command=lambda v: self._enforce_spec_limits(lo=False)
         )
         self.spec_hi_scale.grid(row=r, column=4, sticky="we", padx=2)
         self.spec_hi_scale.set(-30)
@@ -530,11 +597,12 @@ class App(tk.Tk):
         entry = ttk.Entry(parent, textvariable=textvariable, **kwargs)
         entry.grid(row=row, column=col, sticky="we", padx=2)
         
-        # VERSION-AGNOSTIC SOLUTION that handles different variable types:
-        # 1. Force any pending updates
-        entry.update_idletasks()
+        # VERSION-AGNOSTIC SOLUTION that handles different variable types.
+        # No update_idletasks() first: the Entry copies its textvariable
+        # when it is created, so entry.get() is already current, and an
+        # idle flush per entry would run a full layout pass for each one
         
-        # 2. Get the expected value, handling different variable types
+        # 1. Get the expected value, handling different variable types
         try:
             expected_value = textvariable.get()
             # Don't manipulate if it's a numeric variable (DoubleVar/IntVar)
@@ -547,7 +615,7 @@ class App(tk.Tk):
             # If get() fails, just return the entry as-is
             return entry
         
-        # 3. For StringVar only: check and fix if needed
+        # 2. For StringVar only: check and fix if needed
         if isinstance(textvariable, tk.StringVar):
             current_value = entry.get()
             expected_str = str(expected_value) if expected_value else ""
@@ -620,28 +688,42 @@ class App(tk.Tk):
                 print(f"[MAIN_GUI] _sig_update: sig_cfg doesn't exist yet, skipping")
             return
         
-        if hasattr(self, "sig") and self.sig:
-            self.sig.update_cfg(**kwargs)
-        self.sig_cfg.__dict__.update(kwargs)
-
-        # Handle NFFT clamping
+        # Clamp NFFT to [32, buffer length] before it reaches the worker
         if 'fft_pts' in kwargs:
-            total = self.sig_cfg.sample_rate * self.sig_cfg.buf_secs
-            if self.nfft_var.get() > total:
-                self.nfft_var.set(total)
+            fs = int(kwargs.get("sample_rate", self.sig_cfg.sample_rate))
+            secs = int(kwargs.get("buf_secs", self.sig_cfg.buf_secs))
+            total = fs * secs
+            nfft = min(max(32, int(kwargs["fft_pts"])), total)
+            kwargs["fft_pts"] = nfft
             if hasattr(self, "nfft_sld"):
-                self.nfft_sld.configure(to=total)
+                if total != self._nfft_max:
+                    self._nfft_max = total
+                    self.nfft_sld.configure(to=total)
+                if nfft != self._nfft:
+                    self._nfft = nfft  # first: the slider callback sees no change
+                    self.nfft_var.set(nfft)
+                    self.nfft_label.config(text=str(nfft))
+        
+        # The worker keeps sig_cfg (its local_cfg) in sync itself
+        if hasattr(self, "sig") and self.sig:
+            self.sig.update_cfg(**kwargs)
+        else:
+            self.sig_cfg.__dict__.update(kwargs)
                 
     # update amplitude limits (symmetric ±)
+    @staticmethod
+    def _format_volts(val):
+        """Amplitude label text, e.g. '0.500 V' or '5.000e-04 V'."""
+        return f"{val:.3f} V" if val >= 0.001 else f"{val:.3e} V"
+    
     def _update_amp_from_log(self, log_val):
         """Update amplitude from log scale slider using PlotManager."""
-        linear_val = 10 ** float(log_val)
+        log_val = round(float(log_val), 2)
+        hit = self._amp_lut.get(log_val)
+        linear_val, text = hit if hit else (10 ** log_val, self._format_volts(10 ** log_val))
         self.amp_var.set(linear_val)
         # Update the voltage display label
-        if linear_val >= 0.001:
-            self.amp_value_label.config(text=f"{linear_val:.3f} V")
-        else:
-            self.amp_value_label.config(text=f"{linear_val:.3e} V")
+        self.amp_value_label.config(text=text)
         self.plots.set_amplitude_limits(linear_val)
             
     def _update_amp_from_entry(self, event=None):
@@ -652,10 +734,7 @@ class App(tk.Tk):
             self.amp_var.set(val)
             self.amp_log_var.set(np.log10(val))
             # Update the voltage display label
-            if val >= 0.001:
-                self.amp_value_label.config(text=f"{val:.3f} V")
-            else:
-                self.amp_value_label.config(text=f"{val:.3e} V")
+            self.amp_value_label.config(text=self._format_volts(val))
             self.plots.set_amplitude_limits(val)
         except ValueError:
             pass
@@ -689,50 +768,25 @@ class App(tk.Tk):
         self.dur_var.set(str(new_dur))
         self.fs_var.set(str(new_fs))
         
-        # 1 ─ Pause data reception and update buffer without killing worker
+        # 1 ─ Update buffer without killing worker. No pause needed: the
+        # reader swaps to the new ring (carrying the newest samples over)
+        # between packets, so the GUI thread never waits here
         if self.sig:
-            if DEBUG:
-                print(f"[MAIN_GUI] Pausing signal worker for buffer update")
-            # Tell signal worker to pause reception
-            self.sig.pause_reception = True
-            time.sleep(0.1)  # Give time for current packet processing to finish
-            
-            # Flush any pending UDP packets
-            if hasattr(self.sig, '_udp_sock') and self.sig._udp_sock:
-                self.sig._udp_sock.settimeout(0.01)
-                while True:
-                    try:
-                        self.sig._udp_sock.recv(65536)  # Discard data
-                    except socket.timeout:
-                        break
-                    except:
-                        break
-                self.sig._udp_sock.settimeout(0.1)  # Restore timeout
-            
             # Update configuration
             if DEBUG:
                 print(f"[MAIN_GUI] Updating signal configuration")
-            self.sig_cfg.sample_rate = new_fs
-            self.sig_cfg.buf_secs = new_dur
+            # (updates sig_cfg too; the worker allocates the new sample
+            # ring, the reader resizes)
             self.sig.update_cfg(sample_rate=new_fs, buf_secs=new_dur)
-            
-            # Clear the buffer and resize
-            if DEBUG:
-                print(f"[MAIN_GUI] Resizing buffer")
-            self.sig._buf = np.zeros((new_fs * new_dur, 16), dtype=np.float32)
-            self.sig._ptr = 0
-            
-            # Resume reception
-            self.sig.pause_reception = False
-            if DEBUG:
-                print(f"[MAIN_GUI] Resumed signal reception")
         else:
             # No existing worker, create new one
             if DEBUG:
                 print(f"[MAIN_GUI] Creating new signal worker")
             self.sig_cfg = SigConfig(sample_rate=new_fs,
                                      buf_secs=new_dur,
-                                     n_ch=16)
+                                     n_ch=16,
+                                     fft_pts=self._nfft,
+                                     cheb_atten_db=self._cheb_db)
             self.sig = SignalWorker(self.sig_cfg,
                                     data_port=int(self.data_port_var.get()))
             self.sig.start()
@@ -740,18 +794,9 @@ class App(tk.Tk):
         # 2 ─ Update plot manager with new buffer size
         self.plots.resize_buffer(new_fs, new_dur)
         
-        # Update NFFT slider maximum based on new buffer size
+        # NFFT slider maximum/clamp for the new buffer size is applied by
+        # the _sig_update() call below
         total_samples = new_fs * new_dur
-        self.nfft_sld.configure(to=total_samples)
-        if self.nfft_var.get() > total_samples:
-            self.nfft_var.set(total_samples)
-            self.nfft_sld.set(total_samples)  # Update slider position
-            self.nfft_label.config(text=str(total_samples))
-        else:
-            self.nfft_label.config(text=str(self.nfft_var.get()))
-        
-        # Ensure the NFFT slider updates immediately
-        self.nfft_sld.update_idletasks()
         
         # NEW: Update spectrogram window size slider maximum
         spec_max_win = total_samples // 2
@@ -760,6 +805,7 @@ class App(tk.Tk):
             self.spec_win_var.set(spec_max_win)
             self.spec_win_sld.set(spec_max_win)  # Update slider position
             self.spec_win_label.config(text=str(spec_max_win))
+        self._spec_nperseg = self.spec_win_var.get()
         
         # Update the status in console
         self.ser_console.configure(state="normal")
@@ -768,12 +814,28 @@ class App(tk.Tk):
         self.ser_console.see("end")
         
         # Apply current NFFT clamp and cheb_atten immediately
-        self._sig_update(fft_pts=self.nfft_var.get(),
-                         cheb_atten_db=self.cheb_var.get())
+        self._sig_update(fft_pts=self._nfft,
+                         cheb_atten_db=self._cheb_db)
         
         if DEBUG:
             print(f"[MAIN_GUI] === APPLY BUTTON COMPLETE ===")
     
+    def _update_cheb_from_entry(self, event=None):
+        """Sync the cached Chebyshev attenuation after a typed entry."""
+        try:
+            val = float(self.cheb_var.get())
+        except (ValueError, tk.TclError):
+            return
+        self.cheb_scale.set(val)
+        # Tk runs the Scale's command from an idle callback, with the value
+        # rounded to its resolution: apply the typed value after it, and
+        # drop the debounced update it scheduled
+        def apply():
+            self._cancel_debounce("cheb")
+            self._cheb_db = val
+            self._sig_update(cheb_atten_db=val)
+        self.after_idle(apply)
+
     def _enforce_psd(self, lo=True):
         if lo and self.psd_lo.get() >= self.psd_hi.get():
             self.psd_lo.set(self.psd_hi.get() - 1)
@@ -816,36 +878,63 @@ class App(tk.Tk):
         self.plots.reset_maxhold()
         
     def _toggle_channel(self, channel: int):
-        """Force-toggle the checkbox state manually and update plots."""
-        current = self.channel_vars[channel].get()
-        new_val = not current
-        self.channel_vars[channel].set(new_val)
+        """Flip one channel's bit, sync its checkbox and update plots."""
+        self.channel_mask ^= 1 << channel
+        new_val = bool(self.channel_mask >> channel & 1)
+        cb = self.channel_cbs[channel]
+        cb.select() if new_val else cb.deselect()
     
         if DEBUG:
             print(f"[MAIN_GUI] Channel {channel} manually toggled to: {new_val}")
         self.plots.set_channel_visibility(channel, new_val)
+    
+    def _set_channel_mask(self, mask: int):
+        """Apply a whole visibility bitmask to the checkboxes and plots."""
+        self.channel_mask = mask
+        for i, cb in enumerate(self.channel_cbs):
+            cb.select() if mask >> i & 1 else cb.deselect()
+        self.plots.set_channel_mask(mask)
         
     def _select_all_channels(self):
         """Turn ON all channels immediately."""
-        for var in self.channel_vars:
-            var.set(True)
-        self.plots.set_all_channels_visibility([True] * 16)
+        self._set_channel_mask(0xFFFF)
     
     def _select_no_channels(self):
         """Turn OFF all channels immediately."""
-        for var in self.channel_vars:
-            var.set(False)
-        self.plots.set_all_channels_visibility([False] * 16)
+        self._set_channel_mask(0)
 
-    # ── debounced draw ---------------------------------------------------
+    # ── throttled draw ---------------------------------------------------
     def _queue_redraw(self, _):
+        """Throttle Configure-driven redraws: the first event of a resize
+        draws at once (leading edge), the rest collapse into one pending
+        redraw RESIZE_DELAY_MS later (trailing edge, final size)."""
         if self._resize_job is not None:
-            self.after_cancel(self._resize_job)
-        self._resize_job = self.after(self.RESIZE_DELAY_MS, self._do_redraw)
+            return
+        elapsed = time.monotonic() - self._last_draw_t
+        if elapsed * 1000 >= self.RESIZE_DELAY_MS:
+            self._do_redraw()
+        else:
+            self._resize_job = self.after(self.RESIZE_DELAY_MS, self._do_redraw)
 
     def _do_redraw(self):
-        self.plots.draw_full()
+        self.plots.draw_idle()
         self._resize_job = None
+        self._last_draw_t = time.monotonic()
+
+    def _debounce(self, key, ms, fn):
+        """Run fn() once, *ms* after the last call with the same *key*
+        (trailing edge: a slider drag only applies where it stops)."""
+        self._cancel_debounce(key)
+        def fire():
+            self._after_jobs.pop(key, None)
+            fn()
+        self._after_jobs[key] = self.after(ms, fire)
+    
+    def _cancel_debounce(self, key):
+        """Drop a pending _debounce() call for *key*, if any."""
+        job = self._after_jobs.pop(key, None)
+        if job is not None:
+            self.after_cancel(job)
     
     def _toggle_serial(self):
         if self.ser_btn["text"] == "CONNECT":      # ---- connect
@@ -877,15 +966,13 @@ class App(tk.Tk):
         snd("apply and reboot")
         
     # ── refresh COM-port list ───────────────────────────────────────────
-    def _refresh_ports(self):
-        try:
-            plist = SerialManager.ports()          # fresh scan every call
-        except Exception as e:                     # catch any PySerial/WMI error
-            plist = []
+    def _update_port_list(self, plist, err=None):
+        """Apply a changed port set reported by PortScanner."""
+        if err is not None:
             # Log error to console for debugging
             if self.ser_console:
                 self.ser_console.configure(state="normal")
-                self.ser_console.insert("end", f"[PC] ⚠ Port scan error: {e}\n")
+                self.ser_console.insert("end", f"[PC] ⚠ Port scan error: {err}\n")
                 self.ser_console.configure(state="disabled")
                 self.ser_console.see("end")
         
@@ -898,9 +985,6 @@ class App(tk.Tk):
                 self.port_cb.current(0)
             except tk.TclError:
                 pass                           # widget may be disabled
-    
-        # ←————  schedule the next scan! (ALWAYS happens now, even on error)
-        self.after(1000, self._refresh_ports)
 
     # ── IO blocks --------------------------------------------------------
     def _build_io_block(self, col_idx, title, build_controls):
@@ -956,9 +1040,8 @@ class App(tk.Tk):
         self.pass_var = tk.StringVar(value="")
         self.pass_entry = ttk.Entry(parent, textvariable=self.pass_var, show="*")
         self.pass_entry.grid(row=4, column=1, sticky="we", padx=2)
-        # Password Entry doesn't use _create_entry, so handle it separately
-        # Force update and check if empty (for Python 3.12 compatibility)
-        self.pass_entry.update_idletasks()
+        # Password Entry doesn't use _create_entry, so handle it separately:
+        # check if empty (for Python 3.12 compatibility)
         if not self.pass_entry.get() and self.pass_var.get():
             self.pass_entry.insert(0, self.pass_var.get())
 
@@ -978,8 +1061,12 @@ class App(tk.Tk):
                    ).grid(row=7, column=0, columnspan=2,
                           sticky="we", pady=(4, 0))
 
-        # initialise port list & schedule refresh
-        self._refresh_ports()
+        # port list is filled (and kept current) by the background scanner;
+        # pointing at or opening the list asks for a fresh scan right away
+        self.port_scanner = PortScanner(self.port_q, self.stop_evt)
+        self.port_scanner.start()
+        self.port_cb.bind("<Enter>", lambda e: self.port_scanner.rescan(), add="+")
+        self.port_cb.configure(postcommand=self.port_scanner.rescan)
 
     # ── Wi-Fi / board-control panel ───────────────────────────────────────
     def _wifi_controls(self, parent):
@@ -987,6 +1074,11 @@ class App(tk.Tk):
         # helpers ──────────────────────────────────────────────────────────
         parent.columnconfigure(0, weight=1)          # whole column stretches
 
+        # two-way selectors: header → buttons / active side, (header, side) → cmd
+        self._twoway_btns = {}
+        self._twoway_state = {}
+        self._twoway_cmds = {}
+
         def row_frame(r, n_cols):
             """Return a frame with *n_cols* equal-width columns at grid-row r."""
             frm = ttk.Frame(parent); frm.grid(row=r, column=0, sticky="we")
@@ -1003,9 +1095,10 @@ class App(tk.Tk):
         
             labels : (left_text, right_text)
             default: "A" | "B"  → which button is active at start
+            
+            The header *text* names the selector in the shared dispatch
+            tables; clicks go through self._twoway_click.
             """
-            state = {"sel": None}                         # current side
-        
             # header
             self._create_label(frm, text, 0, col, columnspan=2, sticky="we", pady=(0, 1))
         
@@ -1019,23 +1112,17 @@ class App(tk.Tk):
             btnA.grid(row=0, column=0, sticky="we", padx=1)
             btnB.grid(row=0, column=1, sticky="we", padx=1)
         
-            def _apply_styles():
-                btnA.configure(style="Active.TButton" if state["sel"] == "A" else "TButton")
-                btnB.configure(style="Active.TButton" if state["sel"] == "B" else "TButton")
-        
-            def _click(which):
-                if state["sel"] == which:                 # already active
-                    return
-                state["sel"] = which
-                _apply_styles()
-                self._send_udp_cmd(cmd_a if which == "A" else cmd_b)
-        
-            btnA.configure(command=lambda: _click("A"))
-            btnB.configure(command=lambda: _click("B"))
+            self._twoway_btns[text] = {"A": btnA, "B": btnB}
+            self._twoway_cmds[(text, "A")] = cmd_a
+            self._twoway_cmds[(text, "B")] = cmd_b
+            btnA.configure(command=lambda: self._twoway_click(text, "A"))
+            btnB.configure(command=lambda: self._twoway_click(text, "B"))
         
             # initialise
-            state["sel"] = default
-            _apply_styles()
+            self._twoway_state[text] = default
+            btns = self._twoway_btns[text]
+            btns["A"].configure(style=self.ACTIVE_BTN if default == "A" else self.PLAIN_BTN)
+            btns["B"].configure(style=self.ACTIVE_BTN if default == "B" else self.PLAIN_BTN)
 
 
         # ──────────────────────────────────────────────────────────────────
@@ -1088,6 +1175,8 @@ class App(tk.Tk):
         self._create_label(f, "DC-CUTOFF", 0, 0, sticky="e", padx=2)
         
         dc_values          = ["0.5", "1", "2", "4", "8"]
+        # readonly combobox → only these values; commands built once here
+        self._dccut_cmds   = {v: f"sys dccutofffreq {v}" for v in dc_values}
         self.dccut_var     = tk.StringVar(value=dc_values[0])
         dccut_cb           = ttk.Combobox(
             f, textvariable=self.dccut_var, state="readonly", values=dc_values
@@ -1097,7 +1186,7 @@ class App(tk.Tk):
         ttk.Button(
             f, text="SET",
             command=lambda cb=dccut_cb:
-                self._send_udp_cmd(f"sys dccutofffreq {cb.get()}")
+                self._send_udp_cmd(self._dccut_cmds[cb.get()])
         ).grid(row=0, column=2, sticky="we", padx=2, pady=1)
         
         # ── digital-gain dropdown ───────────────────────────────────────
@@ -1105,6 +1194,7 @@ class App(tk.Tk):
         self._create_label(f, "DIGITAL GAIN", 0, 0, sticky="e", padx=2)
         
         gain_values        = ["1", "2", "4", "8", "16", "32", "64", "128", "256"]
+        self._gain_cmds    = {v: f"sys digitalgain {v}" for v in gain_values}
         self.gain_var      = tk.StringVar(value=gain_values[0])
         gain_cb            = ttk.Combobox(
             f, textvariable=self.gain_var, state="readonly", values=gain_values
@@ -1114,7 +1204,7 @@ class App(tk.Tk):
         ttk.Button(
             f, text="SET",
             command=lambda cb=gain_cb:
-                self._send_udp_cmd(f"sys digitalgain {cb.get()}")
+                self._send_udp_cmd(self._gain_cmds[cb.get()])
         ).grid(row=0, column=2, sticky="we", padx=2, pady=1)
 
         # ── continuous-mode controls ─────────────────────────────────────
@@ -1144,15 +1234,28 @@ class App(tk.Tk):
             self.wifi_console.insert("end", "[PC] ✖ INVALID CONTROL-PORT\n")
             return
 
-        self.udp = UDPManager(port)
-        self.udp.start()
-        self.udp.rx_q = self.wifi_q
+        # Board replies share the console queue from the first message on
+        self.udp = UDPManager(port, rx_q=self.wifi_q)
         self.udp.tx_hook = lambda pkt: self.wifi_q.put(f"[PC_] {pkt}\n")
+        self.udp.start()
 
         self.wifi_btn.config(text="DISCONNECT", style="Active.TButton")
         self.wifi_console.insert(
             "end", f"[PC] UDP LISTENING ON *:{port} … WAITING FOR BEACON\n")
 
+    # ── two-way selector click ───────────────────────────────────────────
+    def _twoway_click(self, group: str, which: str):
+        """Activate side *which* ("A"/"B") of two-way selector *group* and
+        send its command; clicking the already active side does nothing."""
+        prev = self._twoway_state[group]
+        if prev == which:
+            return
+        self._twoway_state[group] = which
+        btns = self._twoway_btns[group]
+        btns[prev].configure(style=self.PLAIN_BTN)
+        btns[which].configure(style=self.ACTIVE_BTN)
+        self._send_udp_cmd(self._twoway_cmds[(group, which)])
+
     # ── helper: transmit one command over UDP (no local echo) ─────────────
     def _send_udp_cmd(self, cmd: str):
         """
@@ -1167,80 +1270,140 @@ class App(tk.Tk):
     # ── animate plots ----------------------------------------------------
     def _animate_plots(self):
         """
-        Animation loop that updates plots every 16ms using PlotManager.
+        Animation loop that updates plots every FRAME_MS using PlotManager.
         """
         # stay idle until UDP really connected
         if not (self.udp and self.udp.board_ip):
-            self.after(100, self._animate_plots)
+            self._anim_job = self.after(self.IDLE_POLL_MS, self._animate_plots)
             return
     
         if not self.sig:  # Safety check
-            self.after(100, self._animate_plots)
+            self._anim_job = self.after(self.IDLE_POLL_MS, self._animate_plots)
+            return
+            
+        # No samples published since the last frame and no setting changed
+        # (display_rev covers channel, visibility and max-hold changes)
+        # → skip the snapshot IPC round-trip, just flush a frame the DSP
+        # thread may still have finished
+        params = (self._nfft, self._cheb_db, self._spec_nperseg,
+                  self.sig_cfg.sample_rate, self.sig_cfg.buf_secs,
+                  self.plots.display_rev)
+        last = self._last_plot_key
+        if not self.sig.data_ready.is_set() and last and last[1:] == params:
+            self.plots.present_frame()
+            self._next_frame()
             return
+        self.sig.data_ready.clear()
             
         snap = self.sig.snapshot()
         if snap is None:
-            self.after(16, self._animate_plots)
+            self._next_frame()
+            return
+    
+        # Same snapshot and settings as the last frame → nothing to redo
+        plot_key = (snap.get("seq"), *params)
+        if plot_key == last:
+            self.plots.present_frame()
+            self._next_frame()
             return
+        self._last_plot_key = plot_key
     
         if DEBUG:
             print(f"[MAIN_GUI] === ANIMATE PLOTS ===")
         
         # Update plots using PlotManager
-        data = snap["data"]  # (N,16)
+        data = snap["data"]  # (16, N) channel-major float32
         timestamps = snap.get("time", None)  # Get timestamps if available
         # Always use the current configuration values
         fs_val = self.sig_cfg.sample_rate
         duration = self.sig_cfg.buf_secs
         
-        # Pass current settings to PlotManager
+        # Pass current settings to PlotManager. Slider values come from the
+        # plain-Python mirrors (_nfft, _cheb_db, _spec_nperseg) that the widget
+        # callbacks keep in sync - a Tk variable .get() is a Tcl round-trip.
         self.plots.update_snapshot(
             data=data,
             fs=fs_val,
             duration=duration,
             timestamps=timestamps,
-            nfft=self.nfft_var.get(),
-            cheb_db=self.cheb_var.get(),
-            spec_nperseg=self.spec_win_var.get()
+            nfft=self._nfft,
+            cheb_db=self._cheb_db,
+            spec_nperseg=self._spec_nperseg,
+            seq=snap.get("seq"),
+            psd=snap.get("psd"),
+            psd_freqs=snap.get("psd_freqs"),
+            psd_key=snap.get("psd_key")
         )
         
-        self.after(16, self._animate_plots)
+        self._next_frame()
+
+    def _next_frame(self):
+        """Schedule the next animation tick on a fixed FRAME_MS deadline grid:
+        slow frames and late timers shorten the following wait instead of
+        adding up, and more than two frames behind (or after an idle wait)
+        the grid restarts from now rather than bursting to catch up. Tk
+        always gets at least 1 ms to handle pending events."""
+        now = time.monotonic()
+        period = self.FRAME_MS / 1000
+        self._frame_deadline += period
+        if now - self._frame_deadline > 2 * period:
+            self._frame_deadline = now + period
+        delay = int((self._frame_deadline - now) * 1000)
+        self._anim_job = self.after(max(1, delay), self._animate_plots)
 
     # ── queue → console pump ──────────────────────────────────────────
     def _poll_queues(self):
         """Transfer any new text from worker queues into their Text widgets
         and reschedule itself every 50 ms."""
-        self._drain(self.ser.rx_q if self.ser else None,  self.ser_console)
-        self._drain(self.wifi_q,    self.wifi_console)
-        if self.udp:                                    # board replies
-            self._drain(self.udp.rx_q, self.wifi_console)
+        for q, console in ((self.ser.rx_q if self.ser else None, self.ser_console),
+                           (self.wifi_q, self.wifi_console)):  # incl. board replies
+            if q and q.ready.is_set():
+                q.ready.clear()
+                if self._drain(q, console):
+                    q.ready.set()                       # capped: rest next tick
+        try:
+            while True:                                 # port set changed
+                self._update_port_list(*self.port_q.get_nowait())
+        except queue.Empty:
+            pass
         self.after(50, self._poll_queues)
 
-    @staticmethod
-    def _drain(q, console):
-        if not q:  # Safety check
-            return
+    @classmethod
+    def _drain(cls, q, console):
+        """Move pending messages from *q* into *console*; True if the
+        per-tick cap left messages behind."""
+        # Collect pending messages first, then hit the Text widget once:
+        # one insert = one reflow, instead of one per message. The byte cap
+        # keeps a flood from freezing the GUI; the rest waits for next tick.
+        buf, size = [], 0
+        try:
+            while size < cls.DRAIN_MAX_CHARS:
+                msg = q.get_nowait()
+                buf.append(msg)
+                size += len(msg)
+        except queue.Empty:
+            pass
+        if not buf:
+            return False
             
         console.configure(state="normal")
 
         # Remember if the view is already at the bottom BEFORE inserting
         at_bottom = console.yview()[1] == 1.0
 
-        # Limit drain iterations to prevent GUI freeze
-        max_items = 50
-        items_processed = 0
-        try:
-            while items_processed < max_items:
-                console.insert("end", q.get_nowait())
-                items_processed += 1
-        except queue.Empty:
-            pass
+        console.insert("end", "".join(buf))
+        
+        # Keep the widget bounded - drop the oldest lines
+        excess = int(console.index("end-1c").split(".")[0]) - cls.CONSOLE_MAX_LINES
+        if excess > 0:
+            console.delete("1.0", f"{excess + 1}.0")
 
         console.configure(state="disabled")
 
         # Only autoscroll if the user was already at the bottom
         if at_bottom:
             console.see("end")
+        return size >= cls.DRAIN_MAX_CHARS
 
     # ── shutdown / window-close handler ─────────────────────────────────
     def _on_close(self):
@@ -1252,20 +1415,18 @@ class App(tk.Tk):
         
         # Cancel all pending after() callbacks first
         try:
-            self.after_cancel(self._animate_plots)
+            self.after_cancel(self._anim_job)
         except:
             pass
         try:
             self.after_cancel(self._poll_queues)
         except:
             pass
-        try:
-            self.after_cancel(self._refresh_ports)
-        except:
-            pass
         
         # tell timers & workers to stop
         self.stop_evt.set()
+        self.port_scanner.rescan()  # wake it so it sees stop_evt
+        self.plots.close()
     
         # stop signal worker (IMPORTANT: This runs a subprocess)
         if self.sig:
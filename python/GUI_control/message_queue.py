@@ -0,0 +1,40 @@
+# ─── message_queue.py ────────────────────────────────────────────
+"""
+Console message queue shared by the UDP and serial backends.
+
+Both backends push status lines and board replies for the GUI console
+through a MessageQueue; keeping it here means neither backend has to
+import the other.
+"""
+
+import threading
+import queue
+from collections import deque
+
+
+class MessageQueue:
+    """
+    Bounded, drop-oldest console message queue.
+    
+    A drop-in for the queue.Queue put()/get_nowait() subset the GUI
+    uses, backed by a deque(maxlen) so a chatty board can never grow it
+    without bound. deque append/popleft are atomic, so producers never
+    take a lock. `ready` is set on every put() for consumers that want
+    to wait or skip polling while nothing arrived.
+    """
+    
+    def __init__(self, maxlen: int = 4096):
+        self._dq = deque(maxlen=maxlen)
+        self.ready = threading.Event()
+    
+    def put(self, msg: str) -> None:
+        """Append *msg*, dropping the oldest one when full."""
+        self._dq.append(msg)
+        self.ready.set()
+    
+    def get_nowait(self) -> str:
+        """Pop the oldest message; raises queue.Empty when there is none."""
+        try:
+            return self._dq.popleft()
+        except IndexError:
+            raise queue.Empty from None
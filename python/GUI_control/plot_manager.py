@@ -5,16 +5,22 @@ Evangelion/NERV Style Edition
 FIXED: Removed flush_events() call that was causing window grab/drag issues
 """
 
+import queue
+import threading
+import time
 import numpy as np
-import scipy.signal as sps
-from scipy.signal import get_window
 import matplotlib
 matplotlib.use("TkAgg")
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.transforms import Bbox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 from matplotlib import font_manager
 
+from dsp_kernels import maxhold, timestamp_dt, warmup as warmup_kernels
+from signal_backend import PsdEngine
+
 # NERV/Evangelion color palette
 NERV_BLACK = "#000000"
 NERV_AMBER = "#FFB000"  # Primary amber/yellow
@@ -63,7 +69,31 @@ def ricker_wavelet(points, width):
     return A * (1 - (t**2) / wsq) * np.exp(-(t**2) / (2 * wsq))
 
 
-def ricker_cwt(x, widths, min_points=6):
+def ricker_bank(widths, n, min_points=6):
+    """
+    Build the float32 Ricker wavelets ricker_cwt() convolves with.
+    
+    Args:
+        widths: Array of wavelet widths
+        n: Signal length the bank will be applied to
+        min_points: Minimum points for wavelet
+        
+    Returns:
+        List with one wavelet per width (None where it would be longer
+        than the signal)
+    """
+    bank = []
+    for width in widths:
+        points = max(2 * int(width), min_points)
+        if points < min_points or points > n:
+            # Skip wavelets that are too short or longer than signal
+            bank.append(None)
+        else:
+            bank.append(ricker_wavelet(points, width).astype(np.float32))
+    return bank
+
+
+def ricker_cwt(x, widths, min_points=6, bank=None):
     """
     Compute continuous wavelet transform using Ricker wavelets.
     
@@ -71,18 +101,17 @@ def ricker_cwt(x, widths, min_points=6):
         x: Input signal
         widths: Array of wavelet widths
         min_points: Minimum points for wavelet
+        bank: Precomputed ricker_bank(widths, len(x), min_points)
         
     Returns:
         CWT matrix
     """
-    output = np.zeros((len(widths), len(x)), dtype=np.float32)
-    for idx, width in enumerate(widths):
-        points = max(2 * int(width), min_points)
-        if points < min_points or points > len(x):
-            # Skip wavelets that are too short or longer than signal
-            continue
-        wavelet = ricker_wavelet(points, width)
-        output[idx, :] = np.convolve(x, wavelet, mode='same')
+    if bank is None:
+        bank = ricker_bank(widths, len(x), min_points)
+    output = np.zeros((len(bank), len(x)), dtype=np.float32)
+    for idx, wavelet in enumerate(bank):
+        if wavelet is not None:
+            output[idx, :] = np.convolve(x, wavelet, mode='same')
     return output
 
 
@@ -98,6 +127,11 @@ class PlotManager:
     - NERV/Evangelion visual style
     """
     
+    # New data refreshes the spectrogram/wavelet at most this often (s);
+    # the time traces still follow every frame (the PSD is throttled by
+    # the reader's PSD_INTERVAL)
+    WAVSPEC_INTERVAL = 1 / 8
+    
     def __init__(self, parent_frame, bg_color="#000000", debug=False, style="evangelion"):
         """
         Initialize the plot manager.
@@ -117,6 +151,7 @@ class PlotManager:
         self._psd_min = -150
         self._psd_max = -20
         self._amp_limit = 0.5
+        self.channel_visible = [True] * 16  # All channels visible by default
         
         # Create figure with 5 subplots
         self.fig = Figure(facecolor=NERV_BLACK, dpi=100)
@@ -161,57 +196,52 @@ class PlotManager:
         
         # Use a color palette for the 16 channels
         self.channel_colors = self._generate_channel_colors()
-        self.time_lines = [self.ax_time.plot(xs, np.zeros(N0), lw=1.0, 
-                                             color=self.channel_colors[i], alpha=0.9)[0] 
-                          for i in range(16)]
+        self._make_time_collection(xs)
         
         # Create image artists with NERV colormap
         self.nerv_cmap = self._create_nerv_colormap()
+        # The DSP thread hands over uint8 colormap indices (see _to_u8),
+        # so the images skip normalisation entirely (NoNorm)
         self.im_wavelet = self.ax_wav.imshow(
-            np.zeros((64, N0)), origin="lower", aspect="auto", 
-            extent=(0, N0/250.0, 1, 125), vmin=-120, vmax=-30,
+            np.zeros((64, N0), dtype=np.uint8), origin="lower", aspect="auto", 
+            extent=(0, N0/250.0, 1, 125), norm=matplotlib.colors.NoNorm(),
             cmap=self.nerv_cmap, interpolation='bilinear'
         )
         self.im_specgram = self.ax_sg.imshow(
-            np.zeros((64, N0)), origin="lower", aspect="auto",
-            extent=(0, N0/250.0, 0, 125), vmin=-120, vmax=-30,
+            np.zeros((64, N0), dtype=np.uint8), origin="lower", aspect="auto",
+            extent=(0, N0/250.0, 0, 125), norm=matplotlib.colors.NoNorm(),
             cmap=self.nerv_cmap, interpolation='bilinear'
         )
         
-        # Create PSD lines
-        self.psd_lines = [self.ax_psd.plot([], [], lw=1.0, 
-                                          color=self.channel_colors[i], alpha=0.9)[0] 
-                         for i in range(16)]
         # Set initial PSD x-axis to positive frequencies only
         self.ax_psd.set_xlim(0, 125)  # 0 to fs/2 for initial 250Hz
-        self.psd_max = [self.ax_psd.plot([], [], lw=1.2, ls="--",
-                                        color=self.channel_colors[i], alpha=0.6)[0]
-                       for i in range(16)]
+        # Max-hold accumulator, (16, n_bins) float32 - see _apply_frame
+        self.maxhold_data = np.empty((16, 0), dtype=np.float32)
+        self.maxhold_enabled = False
+        self._make_psd_collections()
+        # Bumped by every setter that changes what a frame computed from
+        # the same snapshot looks like (channel shown, visibility,
+        # max-hold), so the GUI's "nothing changed" check redoes the frame
+        self.display_rev = 0
         
         # Mark all artists as animated for blitting
         self.dt_line.set_animated(True)
-        for line in self.time_lines:
-            line.set_animated(True)
         self.im_wavelet.set_animated(True)
         self.im_specgram.set_animated(True)
-        for line in (*self.psd_lines, *self.psd_max):
-            line.set_animated(True)
         
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.fig, master=parent_frame)
         self.widget = self.canvas.get_tk_widget()
         self.widget.configure(bg=NERV_BLACK, highlightthickness=0)
         
-        # Background cache for blitting
+        # Background cache for blitting. It is (re)captured only from the
+        # draw_event of a full draw, and dropped as soon as the widget is
+        # resized so a stale, wrongly-sized background is never restored.
         self._bg_cache = None
-        
-        # Connect draw event to save background
-        def _save_bg(evt):
-            if self.debug:
-                print(f"[PLOT_MANAGER] Saving background cache")
-            self._bg_cache = self.canvas.copy_from_bbox(self.fig.bbox)
-        
-        self.fig.canvas.mpl_connect("draw_event", _save_bg)
+        self._blit_bbox = None  # union of the data axes, set by _save_bg
+        self._time_px = 0  # time axes width in pixels, set by _save_bg
+        self.fig.canvas.mpl_connect("draw_event", self._save_bg)
+        self.widget.bind("<Configure>", self.invalidate_background, add="+")
         
         # Initial draw to create background
         self.fig.canvas.draw()
@@ -219,15 +249,99 @@ class PlotManager:
         # State tracking
         self._current_fs = 250
         self._current_duration = 4
-        self.maxhold_data = [None] * 16
-        self.maxhold_enabled = False
-        self.channel_visible = [True] * 16  # All channels visible by default
+        # Artist properties last set by _apply_frame (see _changed)
+        self._shown = {}
+        self._empty_img = np.zeros((64, 0), dtype=np.uint8)
         
         # Wavelet/spectrogram channel and limits
         self.wavspec_channel = 0  # Channel to show in wavelet/spectrogram
         self.wav_vmin, self.wav_vmax = -120, -30
         self.spec_vmin, self.spec_vmax = -120, -30
         
+        # DSP pipeline: the Tk thread drops snapshots into _anim_in_q, the
+        # DSP thread leaves finished frames in _anim_out_q. Both are 1-deep
+        # and drop the oldest entry, so a slow frame never builds a backlog.
+        self._anim_in_q = queue.Queue(maxsize=1)
+        self._anim_out_q = queue.Queue(maxsize=1)
+        self._dsp_stop = threading.Event()
+        
+        # DSP-thread window/frequency caches + fallback PSD (when the
+        # snapshot does not already carry one from the reader process)
+        self._psd_engine = PsdEngine()
+        self._sections = {}  # name -> (input key, result), see _cached_section
+        self._time_x_key = self._time_x = None  # see _decimate_time
+        self._wav_bank_key = self._wav_bank = None  # see _compute_wavelet
+        self._dt_bufs = [np.empty(0, dtype=np.float32)] * 2  # see _compute_frame
+        self._dt_flip = 0
+        self._last_job = None  # resubmitted by _requantize
+        self._dsp_thread = threading.Thread(target=self._dsp_loop, daemon=True,
+                                            name="PlotDSP")
+        self._dsp_thread.start()
+        
+    def _make_time_collection(self, xs):
+        """
+        (Re)create the 16-channel time-domain artist.
+        
+        All traces live in one LineCollection so a frame costs a single
+        set_segments() + draw_artist() instead of 16 Line2D updates.
+        _time_segs is the persistent (16, M, 2) vertex buffer: x is filled
+        by _set_time_x() whenever the (decimated) layout changes, each
+        frame copies the channel-major (16, M) traces into the y column in
+        one broadcast.
+        """
+        self._set_time_x(xs)
+        self.time_lc = LineCollection([], linewidths=1.0, alpha=0.9,
+                                      animated=True)
+        self.ax_time.add_collection(self.time_lc)
+        self._sync_time_visibility()
+    
+    def _set_time_x(self, xs):
+        """Adopt *xs* as the x column of the time-trace vertex buffer."""
+        if getattr(self, "_time_segs", None) is None or self._time_segs.shape[1] != xs.size:
+            self._time_segs = np.zeros((16, xs.size, 2), dtype=np.float32)
+        self._time_segs[:, :, 0] = xs
+        self._time_segs_x = xs
+    
+    def _sync_time_visibility(self):
+        """Show only the visible channels' traces, each in its own colour."""
+        vis = self.channel_visible
+        self.time_lc.set_segments(self._time_segs[vis])
+        self.time_lc.set_color([c for c, v in zip(self.channel_colors, vis) if v])
+    
+    def _make_psd_collections(self):
+        """
+        (Re)create the PSD and max-hold artists.
+        
+        Same scheme as the time traces: one LineCollection each, backed by
+        a persistent (16, n_bins, 2) vertex buffer whose x column is only
+        rewritten when the frequency grid changes (_set_psd_x).
+        """
+        self._set_psd_x(np.zeros(0, dtype=np.float32))
+        self.psd_lc = LineCollection([], linewidths=1.0, alpha=0.9,
+                                     animated=True)
+        self.maxhold_lc = LineCollection([], linewidths=1.2, linestyles="--",
+                                         alpha=0.6, animated=True)
+        self.ax_psd.add_collection(self.psd_lc)
+        self.ax_psd.add_collection(self.maxhold_lc)
+        self.maxhold_lc.set_visible(False)
+        self._sync_psd_visibility()
+    
+    def _set_psd_x(self, freqs):
+        """Adopt *freqs* as the x column of the PSD/max-hold vertex buffers."""
+        self._psd_segs = np.zeros((16, freqs.size, 2), dtype=np.float32)
+        self._psd_segs[:, :, 0] = freqs
+        self._maxhold_segs = self._psd_segs.copy()
+    
+    def _sync_psd_visibility(self):
+        """Show only the visible channels' PSD (and max-hold) curves."""
+        vis = self.channel_visible
+        self._vis_mask = np.array(vis, dtype=np.bool_)  # for the max-hold kernel
+        colors = [c for c, v in zip(self.channel_colors, vis) if v]
+        self.psd_lc.set_segments(self._psd_segs[vis])
+        self.psd_lc.set_color(colors)
+        self.maxhold_lc.set_segments(self._maxhold_segs[vis] if self.maxhold_enabled else [])
+        self.maxhold_lc.set_color(colors)
+    
     def _style_axis(self, ax, ylabel, xlabel=None):
         """Apply NERV styling to an axis"""
         ax.set_facecolor(NERV_BLACK)
@@ -358,66 +472,48 @@ class PlotManager:
         
         # Recreate all artists with NERV colors
         self.dt_line, = self.ax_dt.plot(xs_sec, np.zeros(N0), lw=1.2, color=NERV_GREEN)
-        self.time_lines = [self.ax_time.plot(xs_sec, np.zeros(N0), lw=1.0,
-                                            color=self.channel_colors[i], alpha=0.9)[0]
-                          for i in range(16)]
+        self._make_time_collection(xs_sec)
         
         # Create dummy images with proper extent
         dummy_rows = 64
         self.im_wavelet = self.ax_wav.imshow(
-            np.zeros((dummy_rows, N0)), origin="lower", aspect="auto",
-            extent=(0, duration, 1, fs/2), vmin=self.wav_vmin, vmax=self.wav_vmax,
+            np.zeros((dummy_rows, N0), dtype=np.uint8), origin="lower", aspect="auto",
+            extent=(0, duration, 1, fs/2), norm=matplotlib.colors.NoNorm(),
             cmap=self.nerv_cmap, interpolation='bilinear'
         )
         self.im_specgram = self.ax_sg.imshow(
-            np.zeros((dummy_rows, N0)), origin="lower", aspect="auto",
-            extent=(0, duration, 0, fs/2), vmin=self.spec_vmin, vmax=self.spec_vmax,
+            np.zeros((dummy_rows, N0), dtype=np.uint8), origin="lower", aspect="auto",
+            extent=(0, duration, 0, fs/2), norm=matplotlib.colors.NoNorm(),
             cmap=self.nerv_cmap, interpolation='bilinear'
         )
         
-        self.psd_lines = [self.ax_psd.plot([], [], lw=1.0,
-                                          color=self.channel_colors[i], alpha=0.9)[0] 
-                         for i in range(16)]
-        self.psd_max = [self.ax_psd.plot([], [], lw=1.2, ls="--",
-                                        color=self.channel_colors[i], alpha=0.6)[0]
-                       for i in range(16)]
+        # Reset max-hold data; PSD collections restore channel visibility
+        self.maxhold_data.fill(-np.inf)
+        self._make_psd_collections()
         
         # Mark new artists as animated
         self.dt_line.set_animated(True)
-        for line in self.time_lines:
-            line.set_animated(True)
         self.im_wavelet.set_animated(True)
         self.im_specgram.set_animated(True)
-        for line in (*self.psd_lines, *self.psd_max):
-            line.set_animated(True)
-            
-        # Restore channel visibility settings
-        for i in range(16):
-            self.time_lines[i].set_visible(self.channel_visible[i])
-            self.psd_lines[i].set_visible(self.channel_visible[i])
-            if self.maxhold_enabled and self.channel_visible[i]:
-                self.psd_max[i].set_visible(True)
-            else:
-                self.psd_max[i].set_visible(False)
         
         # Update xlimits
         for ax in (self.ax_time, self.ax_wavelet, self.ax_specgram, self.ax_dt):
             ax.set_xlim(0, duration)
             ax.set_xlabel("TIME [S]", fontsize=10, fontweight='bold', color=NERV_AMBER)
         
-        # Add reference line for expected period in Δt plot
+        # Add reference line for expected period in Δt plot. It only
+        # changes here, so it is part of the blit background (not animated)
         expected_period_us = 1e6 / fs
         self._dt_expected_line = self.ax_dt.axhline(
             y=expected_period_us, 
             color=NERV_ORANGE, 
             linestyle='--', 
             alpha=0.7,
-            linewidth=1.5,
-            animated=True
+            linewidth=1.5
         )
         
-        # Reset max-hold data
-        self.maxhold_data = [None] * 16
+        # New artists: forget what _apply_frame last pushed into them
+        self._shown.clear()
         
         # Update state - MUST be before draw_full
         self._current_fs = fs
@@ -430,12 +526,19 @@ class PlotManager:
     def update_snapshot(self, data: np.ndarray, fs: int, duration: int, 
                        timestamps: np.ndarray = None, nfft: int = 512, 
                        cheb_db: float = 80.0, spec_nperseg: int = 256,
-                       wav_freqs: int = 64):
+                       wav_freqs: int = 64, seq: int = None,
+                       psd: np.ndarray = None, psd_freqs: np.ndarray = None,
+                       psd_key: tuple = None):
         """
         Update all plots with new data snapshot.
         
+        The snapshot is handed to the DSP thread (Δt, spectrogram, wavelet
+        and PSD math) and whatever frame that thread finished since the
+        previous call is pushed to the artists and blitted. The Tk thread
+        therefore only ever pays for artist updates + blit.
+        
         Args:
-            data: (N, 16) array of samples
+            data: (16, N) channel-major array of samples
             fs: Sample rate in Hz
             duration: Expected buffer duration in seconds
             timestamps: (N,) array of hardware timestamps for Δt calculation
@@ -443,166 +546,280 @@ class PlotManager:
             cheb_db: Chebyshev window attenuation in dB
             spec_nperseg: Spectrogram window size
             wav_freqs: Number of frequency points for wavelet transform
+            seq: Snapshot counter from SignalWorker; lets unchanged sections
+                 reuse their previous result (None = always recompute)
+            psd: (16, nfft//2+1) PSD in dB already computed by SignalWorker
+            psd_freqs: Frequency bins for *psd*
+            psd_key: (nfft, cheb_db, fs) *psd* was computed with; it is only
+                     used when this matches the current settings
         """
-        # Check if buffer needs resizing
-        expected_npts = int(duration * fs)
+        # Check if buffer needs resizing (scalar compare, no artist access)
         need_rebuild = (
             fs != self._current_fs or
-            abs(duration - self._current_duration) > 1e-6 or
-            self.time_lines[0].get_xdata().size != expected_npts
+            abs(duration - self._current_duration) > 1e-6
         )
         
         if need_rebuild:
             self.resize_buffer(fs, duration)
             return  # resize_buffer will trigger a full redraw
-            
-        # Create x-axis for full duration
-        xs_sec = np.arange(expected_npts) / fs
         
-        # Update Δt (time differences from timestamps)
+        # Hand the newest snapshot to the DSP thread (drops any unprocessed one)
+        self._last_job = {
+            "data": data, "fs": fs, "duration": duration,
+            "timestamps": timestamps, "nfft": nfft, "cheb_db": cheb_db,
+            "spec_nperseg": spec_nperseg, "wav_freqs": wav_freqs,
+            "wavspec_channel": self.wavspec_channel,
+            "wavspec_visible": self.channel_visible[self.wavspec_channel],
+            "seq": seq, "psd": psd, "psd_freqs": psd_freqs, "psd_key": psd_key,
+            "time_px": self._time_px,
+            "spec_clim": (self.spec_vmin, self.spec_vmax),
+            "wav_clim": (self.wav_vmin, self.wav_vmax),
+        }
+        self._put_latest(self._anim_in_q, self._last_job)
+        
+        # Blit the most recent finished frame, if any
+        self.present_frame()
+    
+    def present_frame(self) -> bool:
+        """
+        Apply and blit the newest frame finished by the DSP thread.
+        
+        Cheap to call when nothing new was submitted: it is how the last
+        in-flight frame still reaches the screen once data stops changing.
+        
+        Returns:
+            True if a frame was drawn
+        """
+        try:
+            frame = self._anim_out_q.get_nowait()
+        except queue.Empty:
+            return False
+        if (frame["fs"] != self._current_fs or
+                frame["npts"] != int(self._current_duration * self._current_fs)):
+            return False  # computed for a buffer layout that no longer exists
+        self._apply_frame(frame)
+        
+        # Perform fast blit update
+        self.draw_blit()
+        return True
+    
+    # ── DSP thread ─────────────────────────────────────────────────────
+    @staticmethod
+    def _put_latest(q, item):
+        """Put *item* into a 1-deep queue, replacing a stale entry if full."""
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            q.put_nowait(item)
+    
+    def _dsp_loop(self):
+        """Worker thread: turn snapshots into ready-to-plot frames."""
+        warmup_kernels()
+        while not self._dsp_stop.is_set():
+            job = self._anim_in_q.get()
+            if job is None:  # close() sentinel
+                break
+            try:
+                frame = self._compute_frame(**job)
+            except Exception as e:
+                if self.debug:
+                    print(f"[PLOT_MANAGER] DSP thread error: {e}")
+                continue
+            self._put_latest(self._anim_out_q, frame)
+    
+    def close(self):
+        """Stop the DSP thread."""
+        self._dsp_stop.set()
+        self._put_latest(self._anim_in_q, None)
+    
+    def _compute_frame(self, data, fs, duration, timestamps, nfft, cheb_db,
+                       spec_nperseg, wav_freqs, wavspec_channel, wavspec_visible,
+                       seq=None, psd=None, psd_freqs=None, psd_key=None,
+                       time_px=0, spec_clim=(-120, -30), wav_clim=(-120, -30)):
+        """
+        Pure NumPy/SciPy part of a plot update (runs on the DSP thread).
+        
+        Touches no matplotlib artists; returns a dict consumed by
+        _apply_frame() on the Tk thread.
+        """
+        expected_npts = int(duration * fs)
+        expected_period_us = 1e6 / fs
+        frame = {"fs": fs, "npts": expected_npts, "duration": duration}
+        
+        # ─────── Δt (time differences from timestamps) ───────
+        # Filled in place into one of two preallocated float32 buffers:
+        # alternating them means the frame the Tk thread is applying is
+        # never the one being overwritten here
+        if self._dt_bufs[0].size != expected_npts:
+            self._dt_bufs = [np.empty(expected_npts, dtype=np.float32) for _ in range(2)]
+        dt_full = self._dt_bufs[self._dt_flip]
+        self._dt_flip ^= 1
+        dt_full.fill(expected_period_us)
         if timestamps is not None and isinstance(timestamps, np.ndarray) and len(timestamps) > 1:
             try:
-                # Calculate time differences between consecutive samples
-                # Hardware timestamps are in units of 8 microseconds
-                time_diffs = np.diff(timestamps.astype(np.int64))
-                
-                # Handle 32-bit wraparound
-                time_diffs = np.where(time_diffs < 0, time_diffs + (1 << 32), time_diffs)
-                
-                # Convert to microseconds (multiply by 8)
-                dt_us = time_diffs.astype(np.float64) * 8.0
-                
-                # Pad with the expected period to match the full buffer size
-                expected_period_us = 1e6 / fs
-                if len(dt_us) < xs_sec.size - 1:
-                    dt_full = np.full(xs_sec.size, expected_period_us)
-                    # Put the actual diffs at the end (most recent data)
-                    start_idx = max(0, xs_sec.size - len(dt_us) - 1)
-                    dt_full[start_idx:start_idx + len(dt_us)] = dt_us
-                else:
-                    # Take the last portion if we have more data
-                    dt_full = np.full(xs_sec.size, expected_period_us)
-                    dt_full[:-1] = dt_us[-(xs_sec.size-1):]
+                # Hardware timestamps are 32-bit counters in units of 8 µs
+                ts = timestamps[-expected_npts:]
+                n_diff = len(ts) - 1
+                # Most recent diffs end one slot before the newest sample
+                timestamp_dt(ts, dt_full[expected_npts - 1 - n_diff:expected_npts - 1])
                 
                 # First sample has no previous sample to diff with
                 dt_full[0] = expected_period_us
-                    
-                self.dt_line.set_ydata(dt_full)
-                
-                # Ensure y-axis limits are updated for current sample rate
-                y_min = expected_period_us - 100
-                y_max = expected_period_us + 100
-                # Clip minimum to 0 if it would go negative
-                if y_min < 0:
-                    y_min = 0
-                self.ax_dt.set_ylim(y_min, y_max)
-                
-                # Update or recreate the horizontal reference line
-                if hasattr(self, '_dt_expected_line'):
-                    self._dt_expected_line.remove()
-                self._dt_expected_line = self.ax_dt.axhline(
-                    y=expected_period_us, 
-                    color=NERV_ORANGE, 
-                    linestyle='--', 
-                    alpha=0.7,
-                    linewidth=1.5,
-                    animated=True
-                )
-                    
-                # Update axis label to show expected period
-                self.ax_dt.set_ylabel(f"TIMING DEVIATION [µS] (EXPECT: {expected_period_us:.0f})", 
-                                     fontsize=10, fontweight='bold', color=NERV_AMBER)
             except Exception as e:
                 if self.debug:
                     print(f"[PLOT_MANAGER] Error updating Δt plot: {e}")
                 # Fall back to showing expected period
-                expected_period_us = 1e6 / fs
-                self.dt_line.set_ydata(np.full(xs_sec.size, expected_period_us))
-        else:
-            # No timestamps available, show expected period
-            expected_period_us = 1e6 / fs
-            self.dt_line.set_ydata(np.full(xs_sec.size, expected_period_us))
-            # Set appropriate limits based on sample rate
-            y_min = expected_period_us - 100
-            y_max = expected_period_us + 100
-            if y_min < 0:
-                y_min = 0
-            self.ax_dt.set_ylim(y_min, y_max)
-            
-            # Update or recreate the horizontal reference line
-            if hasattr(self, '_dt_expected_line'):
-                self._dt_expected_line.remove()
-            self._dt_expected_line = self.ax_dt.axhline(
-                y=expected_period_us, 
-                color=NERV_ORANGE, 
-                linestyle='--', 
-                alpha=0.7,
-                linewidth=1.5,
-                animated=True
-            )
-            
-            self.ax_dt.set_ylabel(f"TIMING DEVIATION [µS] (EXPECT: {expected_period_us:.0f})",
-                                 fontsize=10, fontweight='bold', color=NERV_AMBER)
+                dt_full.fill(expected_period_us)
         
-        # Update time-domain plots
-        if data.shape[0] < xs_sec.size:
+        # ─────── Time-domain traces ───────
+        if data.shape[1] < expected_npts:
             # Pad with zeros if snapshot is smaller than buffer
-            full_data = np.zeros((xs_sec.size, 16))
-            full_data[-data.shape[0]:] = data
-            for i, (ln, ch) in enumerate(zip(self.time_lines, full_data.T)):
-                ln.set_ydata(ch)
-                # Ensure visibility is maintained during updates
-                ln.set_visible(self.channel_visible[i])
+            full_data = np.zeros((16, expected_npts), dtype=np.float32)
+            full_data[:, -data.shape[1]:] = data
         else:
             # Use last portion if we have more data
-            for i, (ln, ch) in enumerate(zip(self.time_lines, data[-xs_sec.size:].T)):
-                ln.set_ydata(ch)
-                # Ensure visibility is maintained during updates
-                ln.set_visible(self.channel_visible[i])
-        
-        # Update spectrogram and wavelet with selected channel
-        if self.channel_visible[self.wavspec_channel]:
-            if data.shape[0] < expected_npts:
-                spec_data = np.zeros(expected_npts)
-                spec_data[-data.shape[0]:] = data[:, self.wavspec_channel]
+            full_data = data[:, -expected_npts:]
+        frame["time_x"], frame["time"] = self._decimate_time(full_data, fs, time_px)
+        # Δt shares the time axis, so it reuses the same decimated x
+        frame["dt"] = self._decimate_time(dt_full[None, :], fs, time_px)[1][0]
+        
+        # ─────── Spectrogram and wavelet for the selected channel ───────
+        # Each section is recomputed only when its own inputs changed: with
+        # the same seq, moving e.g. the NFFT slider leaves the spectrogram
+        # and wavelet untouched (and vice versa)
+        frame["spec"] = frame["wav"] = None
+        if wavspec_visible:
+            spec_data = full_data[wavspec_channel]
+            frame["spec"] = self._cached_section(
+                "spec", (seq, wavspec_channel, spec_nperseg, cheb_db, fs),
+                lambda: self._compute_spec(spec_data, fs, spec_nperseg, cheb_db),
+                self.WAVSPEC_INTERVAL)
+            frame["wav"] = self._cached_section(
+                "wav", (seq, wavspec_channel, wav_freqs, fs),
+                lambda: self._compute_wavelet(spec_data, fs, wav_freqs),
+                self.WAVSPEC_INTERVAL)
+            # dB → colormap indices for the current limits (the float dB
+            # sections stay cached, so a limit change only redoes this),
+            # keeping at most ~2 columns per pixel of the (shared-width) axes
+            for name, clim in (("spec", spec_clim), ("wav", wav_clim)):
+                if frame[name] is not None:
+                    db, f_lo, f_hi = frame[name]
+                    n = db.shape[1]
+                    step = n // (2 * time_px) if time_px > 0 else 1
+                    if step >= 2:
+                        # Every step-th column, aligned to keep the newest
+                        db = db[:, (n - 1) % step::step]
+                    frame[name] = (self._to_u8(db, clim), f_lo, f_hi)
+        
+        # ─────── PSD ───────
+        # Normally computed by the reader process; only fall back to a
+        # local computation while it has not caught up with a new setting
+        # (its PSD was made with a different nfft, window or sample rate)
+        frame["psd"] = None
+        if psd is not None and psd_key == (nfft, cheb_db, fs):
+            frame["psd"], frame["psd_freqs"] = psd, psd_freqs
+        elif data.shape[1] >= nfft:
+            frame["psd"], frame["psd_freqs"] = self._cached_section(
+                "psd", (seq, nfft, cheb_db, fs),
+                lambda: self._psd_engine.compute(data, fs, nfft, cheb_db))
+        
+        return frame
+    
+    def _decimate_time(self, y, fs, px):
+        """
+        Min/max-decimate (ch, N) traces to ~2 vertices per pixel column.
+        
+        With more samples than 2 × the axes width in pixels, each bin of
+        N // px samples becomes its min and max (so spikes survive) at
+        the bin's first/last sample time. The oldest N % stride samples
+        are dropped so the newest sample is always drawn.
+        
+        Returns:
+            (x, y): x is cached and shared while the layout is unchanged,
+            so the Tk thread can test it by identity
+        """
+        n = y.shape[1]
+        stride = n // px if px > 0 else 1
+        if stride < 2:
+            stride, y_out = 1, y
+        else:
+            nb = n // stride
+            start = n - nb * stride
+            blk = y[:, start:].reshape(y.shape[0], nb, stride)
+            y_out = np.empty((y.shape[0], 2 * nb), dtype=np.float32)
+            np.min(blk, axis=2, out=y_out[:, 0::2])
+            np.max(blk, axis=2, out=y_out[:, 1::2])
+        
+        key = (n, stride, fs)
+        if key != self._time_x_key:
+            if stride == 1:
+                x = np.arange(n, dtype=np.float32) / fs
             else:
-                spec_data = data[-expected_npts:, self.wavspec_channel]
-            
-            # Remove DC component by subtracting mean
-            spec_data_dc_removed = spec_data
-            
-            # Calculate 95% overlap
-            noverlap = int(0.95 * spec_nperseg)
-            
-            # Create Chebyshev window for spectrogram
-            try:
-                spec_window = get_window(('chebwin', cheb_db), spec_nperseg, fftbins=False)
-            except:
-                spec_window = np.hamming(spec_nperseg)
-            
-            # Normalize window
-            spec_window = spec_window / np.mean(spec_window)
-            
-            # Compute spectrogram with 95% overlap and DC removed
-            f_s, t_s, Sxx = sps.spectrogram(
-                spec_data_dc_removed, fs=fs, window=spec_window, 
-                nperseg=spec_nperseg, noverlap=noverlap
-            )
-            
-            # Convert to dB and apply limits
-            Sxx_db = 10*np.log10(Sxx + 1e-20)
-            self.im_specgram.set_data(Sxx_db)
-            self.im_specgram.set_extent((0, duration, f_s[0], f_s[-1]))
-            self.im_specgram.set_clim(self.spec_vmin, self.spec_vmax)
-            
-            # Compute proper wavelet transform
-            # Use the same DC-removed data
-            wav_data = spec_data_dc_removed
-            
+                t0 = (start + np.arange(nb) * stride) / fs
+                x = np.empty(2 * nb, dtype=np.float32)
+                x[0::2] = t0
+                x[1::2] = t0 + (stride - 1) / fs
+            self._time_x_key, self._time_x = key, x
+        return self._time_x, y_out
+    
+    @staticmethod
+    def _to_u8(db, clim):
+        """
+        Quantise a dB image to uint8 colormap indices for clim=(vmin, vmax).
+        
+        Picks the same of the 256 colormap entries that Normalize(vmin,
+        vmax) would, with out-of-range values clipped to the end colours.
+        """
+        lo, hi = clim
+        idx = db - lo
+        idx *= 256.0 / max(hi - lo, 1e-6)
+        np.clip(idx, 0, 255, out=idx)
+        return idx.astype(np.uint8)
+    
+    def _cached_section(self, name, key, compute, min_interval=0.0):
+        """
+        Return the last result of section *name* if *key* is unchanged,
+        otherwise compute() it. key[0] is the snapshot seq; None disables
+        reuse (caller did not say whether the data changed).
+        
+        With *min_interval*, a result that differs only by a newer seq is
+        also reused until it is min_interval seconds old; any parameter
+        change still recomputes at once.
+        """
+        last = self._sections.get(name)
+        now = time.perf_counter()
+        if key[0] is not None and last is not None:
+            if last[0] == key:
+                return last[1]
+            if last[0][1:] == key[1:] and now - last[2] < min_interval:
+                return last[1]
+        val = compute()
+        self._sections[name] = (key, val, now)
+        return val
+    
+    def _compute_spec(self, spec_data, fs, nperseg, cheb_db):
+        """Spectrogram in dB as (Sxx_db, f_lo, f_hi)."""
+        # Compute spectrogram with 95% overlap and convert to dB in place
+        # in the fresh float32 result (no temporaries)
+        Sxx, f_hi = self._spectrogram(spec_data, fs, nperseg, cheb_db)
+        Sxx += 1e-20
+        np.log10(Sxx, out=Sxx)
+        Sxx *= 10
+        return Sxx, 0.0, f_hi
+    
+    def _compute_wavelet(self, wav_data, fs, wav_freqs):
+        """Ricker CWT power in dB as (cwt_db, f_lo, f_hi), or None."""
+        # The wavelet bank only depends on fs, the row count and the
+        # signal length: build it when one of those changes, not per frame
+        key = (fs, wav_freqs, len(wav_data))
+        if key != self._wav_bank_key:
             # Define frequency range for wavelets
             nyq = fs / 2
-            N_freqs = wav_freqs  # Use the parameter from GUI
-            freqs = np.linspace(1, nyq, N_freqs)
+            freqs = np.linspace(1, nyq, wav_freqs)
             
             # Convert frequencies to wavelet widths
             # width = fs / (2 * pi * frequency)
@@ -612,78 +829,145 @@ class PlotManager:
             valid = (2 * widths >= 6) & (2 * widths < len(wav_data))
             widths = widths[valid]
             freqs = freqs[valid]
+            bank = ricker_bank(widths, len(wav_data))
+            self._wav_bank_key, self._wav_bank = key, (widths, freqs, bank)
+        widths, freqs, bank = self._wav_bank
+        
+        if len(widths) == 0:
+            return None
+        # Compute CWT and convert to power in dB, in place in the fresh
+        # float32 CWT matrix (no float64 temporaries)
+        cwt_power_db = ricker_cwt(wav_data, widths, bank=bank)
+        np.square(cwt_power_db, out=cwt_power_db)
+        cwt_power_db += 1e-20
+        np.log10(cwt_power_db, out=cwt_power_db)
+        cwt_power_db *= 10
+        return cwt_power_db, freqs[0], freqs[-1]
+    
+    def _spectrogram(self, x, fs, nperseg, cheb_db):
+        """
+        One-sided PSD spectrogram with 95 % overlap, equivalent to
+        sps.spectrogram(x, fs, window, nperseg, noverlap) with the
+        mean-normalised Chebyshev window.
+        
+        Frames are a zero-copy strided view of *x* and all of them go
+        through a single batched rFFT; the window and the FFT (plan) come
+        from the PsdEngine.
+        
+        Returns:
+            (Sxx, f_max): Sxx is (nperseg//2 + 1, n_frames), f_max is the
+            centre frequency of the top bin (fs/2 for even nperseg)
+        """
+        nperseg = min(nperseg, len(x))
+        win = self._psd_engine.window(nperseg, cheb_db)
+        
+        hop = max(1, nperseg - int(0.95 * nperseg))
+        frames = np.lib.stride_tricks.sliding_window_view(x, nperseg)[::hop]
+        # detrend='constant' - remove each segment's mean before windowing
+        frames = (frames - frames.mean(axis=1, keepdims=True)) * win
+        spec = self._psd_engine.rfft(frames)
+        
+        # |X|^2 straight into a C-contiguous (bins, frames) image: the
+        # transpose happens inside the magnitude pass, so every later
+        # step (and matplotlib's resampling) walks contiguous rows
+        Sxx = np.empty((spec.shape[1], spec.shape[0]), dtype=np.float32)
+        np.abs(spec.T, out=Sxx)
+        np.square(Sxx, out=Sxx)
+        
+        # 'density' scaling, doubling every bin except DC (and Nyquist)
+        Sxx *= 1.0 / (fs * np.dot(win, win))
+        if nperseg % 2:
+            Sxx[1:] *= 2
+        else:
+            Sxx[1:-1] *= 2
+        return Sxx, (nperseg // 2) * fs / nperseg
+    
+    # ── Tk-side artist updates ─────────────────────────────────────────
+    def _apply_frame(self, frame):
+        """Push a finished DSP frame into the matplotlib artists."""
+        duration = frame["duration"]
+        expected_npts = frame["npts"]
+        
+        # Update Δt. Its y-limits, reference line and label depend only on
+        # fs, and present_frame() only applies frames matching the current
+        # fs, so resize_buffer() has already set them
+        if frame["time_x"] is not self._time_segs_x:
+            # Decimation layout changed (both share the time x)
+            self._set_time_x(frame["time_x"])
+            self.dt_line.set_data(frame["time_x"], frame["dt"])
+        else:
+            self.dt_line.set_ydata(frame["dt"])
+        
+        # Update time-domain plots: one collection, one set_segments call
+        self._time_segs[:, :, 1] = frame["time"]
+        self.time_lc.set_segments(self._time_segs[self.channel_visible])
+        
+        # Update spectrogram and wavelet with selected channel. Extents and
+        # axis limits are only touched when they change (each setter marks
+        # the artist/axes stale and may re-run autoscaling); colour limits
+        # are owned by set_wavelet_limits()/set_specgram_limits()
+        if frame["spec"] is not None:
+            self._shown["wavspec_empty"] = False
+            Sxx_db, f_lo, f_hi = frame["spec"]
+            self.im_specgram.set_data(Sxx_db)
+            if self._changed("spec_extent", (duration, f_lo, f_hi)):
+                self.im_specgram.set_extent((0, duration, f_lo, f_hi))
             
-            if len(widths) > 0:
-                # Compute CWT
-                cwt_matrix = ricker_cwt(wav_data, widths)
-                
-                # Convert to power in dB
-                cwt_power_db = 10 * np.log10(np.abs(cwt_matrix)**2 + 1e-20)
-                
-                # Update wavelet plot
+            if frame["wav"] is not None:
+                cwt_power_db, f_lo, f_hi = frame["wav"]
                 self.im_wavelet.set_data(cwt_power_db)
-                self.im_wavelet.set_extent((0, duration, freqs[0], freqs[-1]))
-                self.im_wavelet.set_clim(self.wav_vmin, self.wav_vmax)
-                
-                # Update y-axis to show actual frequency range
-                self.ax_wav.set_ylim(freqs[0], freqs[-1])
+                if self._changed("wav_extent", (duration, f_lo, f_hi)):
+                    self.im_wavelet.set_extent((0, duration, f_lo, f_hi))
+                    # Update y-axis to show actual frequency range; the
+                    # ticks live in the background, so redraw it
+                    self.ax_wav.set_ylim(f_lo, f_hi)
+                    self.draw_idle()
             else:
                 # No valid wavelets, show empty
-                empty = np.zeros((64, expected_npts))
-                self.im_wavelet.set_data(empty)
-        else:
+                self.im_wavelet.set_data(self._empty_image(expected_npts))
+        elif self._changed("wavspec_empty", True):
             # Selected channel is hidden - show empty spectrograms
-            empty = np.zeros((64, expected_npts))
+            empty = self._empty_image(expected_npts)
             self.im_specgram.set_data(empty)
             self.im_wavelet.set_data(empty)
         
         # Update PSD
-        try:
-            win = get_window(('chebwin', cheb_db), nfft, fftbins=False)
-        except:
-            win = np.hamming(nfft)
-        
-        # Normalize window by its mean
-        win = win / np.mean(win)
-            
-        freqs = np.fft.rfftfreq(nfft, d=1/fs)
-        
-        for idx in range(16):
-            if len(data) >= nfft:
-                # Get segment without removing DC (keep original signal)
-                seg = data[-nfft:, idx]
-                seg_windowed = seg * win
-                # Perform FFT with normalization by length
-                fft_result = np.fft.rfft(seg_windowed) / nfft
-                psd = 20*np.log10(np.abs(fft_result) + 1e-20)
-                self.psd_lines[idx].set_data(freqs, psd)
-                # Ensure visibility is maintained
-                self.psd_lines[idx].set_visible(self.channel_visible[idx])
-                
-                if self.maxhold_enabled and self.channel_visible[idx]:
-                    mh = self.maxhold_data[idx]
-                    if mh is None or len(mh) != len(psd):
-                        self.maxhold_data[idx] = psd.copy()
-                        if self.debug:
-                            print(f"[PLOT_MANAGER] Initializing max-hold for channel {idx}")
-                    else:
-                        self.maxhold_data[idx] = np.maximum(mh, psd)
-                    self.psd_max[idx].set_data(freqs, self.maxhold_data[idx])
-                    self.psd_max[idx].set_visible(True)
-                    if self.debug:
-                        print(f"[PLOT_MANAGER] Max-hold updated for channel {idx}, visible={self.psd_max[idx].get_visible()}")
-                else:
-                    self.psd_max[idx].set_visible(False)
-            else:
-                # Not enough data for FFT - hide the line
-                self.psd_lines[idx].set_visible(False)
-                self.psd_max[idx].set_visible(False)
-                    
-        # Ensure PSD x-axis shows correct frequency range
-        self.ax_psd.set_xlim(0, fs / 2)
-        
-        # Perform fast blit update
-        self.draw_blit()
+        psd = frame["psd"]
+        if psd is not None and self.maxhold_enabled:
+            # Accumulate in place into the persistent buffer (visible
+            # channels only); reallocated only when the bin count changes
+            if self.maxhold_data.shape != psd.shape:
+                self.maxhold_data = np.full(psd.shape, -np.inf, dtype=np.float32)
+                if self.debug:
+                    print(f"[PLOT_MANAGER] Initializing max-hold buffer {psd.shape}")
+            maxhold(psd, self.maxhold_data, self._vis_mask)
+        # Not enough data for FFT - hide the PSD until there is
+        self.psd_lc.set_visible(psd is not None)
+        self.maxhold_lc.set_visible(psd is not None and self.maxhold_enabled)
+        if psd is not None:
+            freqs = frame["psd_freqs"]
+            if self._changed("psd_x", (freqs.size, float(freqs[-1]))):
+                self._set_psd_x(freqs)
+            vis = self.channel_visible
+            self._psd_segs[:, :, 1] = psd
+            self.psd_lc.set_segments(self._psd_segs[vis])
+            if self.maxhold_enabled:
+                self._maxhold_segs[:, :, 1] = self.maxhold_data
+                self.maxhold_lc.set_segments(self._maxhold_segs[vis])
+        # (PSD x-range 0..fs/2 is set by resize_buffer)
+    
+    def _empty_image(self, n):
+        """Shared all-zero (64, n) uint8 image for 'nothing to show'."""
+        if self._empty_img.shape[1] != n:
+            self._empty_img = np.zeros((64, n), dtype=np.uint8)
+        return self._empty_img
+    
+    def _changed(self, key, value) -> bool:
+        """True (and remember *value*) if it differs from the last *key*."""
+        if self._shown.get(key) == value:
+            return False
+        self._shown[key] = value
+        return True
         
     def set_amplitude_limits(self, volts: float):
         """Update time plot y-axis limits."""
@@ -691,7 +975,7 @@ class PlotManager:
         self.ax_time.set_ylim(-volts, volts)
         if self.debug:
             print(f"[PLOT_MANAGER] Set amplitude limits: ±{volts}V")
-        self.draw_full()
+        self.draw_idle()  # axes changed → background must be redrawn
         
     def set_psd_limits(self, min_db: float, max_db: float):
         """Update PSD plot limits."""
@@ -700,39 +984,54 @@ class PlotManager:
         self.ax_psd.set_ylim(min_db, max_db)
         if self.debug:
             print(f"[PLOT_MANAGER] Set PSD limits: {min_db} to {max_db} dB")
-        self.draw_full()
+        self.draw_idle()  # axes changed → background must be redrawn
         
     def set_maxhold(self, enabled: bool):
         """Toggle max-hold display."""
         self.maxhold_enabled = enabled
-        for idx in range(16):
-            # Only show max-hold if channel is visible
-            visible = enabled and self.channel_visible[idx]
-            self.psd_max[idx].set_visible(visible)
-            if self.debug:
-                print(f"[PLOT_MANAGER] Max-hold line {idx}: visible={visible} (enabled={enabled}, ch_visible={self.channel_visible[idx]})")
+        self.display_rev += 1
+        self.maxhold_lc.set_visible(enabled and self.psd_lc.get_visible())
         if not enabled:
-            self.maxhold_data = [None] * 16
+            self.maxhold_data.fill(-np.inf)
+            self.maxhold_lc.set_segments([])
         if self.debug:
             print(f"[PLOT_MANAGER] Max-hold: {enabled}")
-        self.draw_full()
+        self.draw_blit()  # only animated artists changed
         
     def reset_maxhold(self):
         """Reset max-hold data."""
-        self.maxhold_data = [None] * 16
-        for ln in self.psd_max:
-            ln.set_visible(False)
-            ln.set_data([], [])
+        self.maxhold_data.fill(-np.inf)
+        self.maxhold_lc.set_segments([])  # refilled by the next frame
+        self.display_rev += 1
         if self.debug:
             print(f"[PLOT_MANAGER] Max-hold reset")
-        self.draw_full()
+        self.draw_blit()  # only animated artists changed
         
+    def _save_bg(self, evt=None):
+        """draw_event handler - cache the freshly drawn static background."""
+        if self.debug:
+            print(f"[PLOT_MANAGER] Saving background cache")
+        self._bg_cache = self.canvas.copy_from_bbox(self.fig.bbox)
+        # Animated artists are clipped to their axes, so only this area
+        # (without titles, tick labels and margins) changes between frames
+        self._blit_bbox = Bbox.union([ax.bbox for ax in (
+            self.ax_dt, self.ax_time, self.ax_sg, self.ax_wav, self.ax_psd)])
+        # Layout is final here: time-trace decimation target for the DSP thread
+        self._time_px = int(self.ax_time.bbox.width)
+
+    def invalidate_background(self, evt=None):
+        """Drop the blit background (e.g. on resize) until the next full draw."""
+        self._bg_cache = None
+
     def draw_full(self):
-        """Force complete redraw and update background cache."""
+        """Force complete redraw; the draw_event refreshes the background."""
         if self.debug:
             print(f"[PLOT_MANAGER] Full redraw")
         self.canvas.draw()
-        self._bg_cache = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def draw_idle(self):
+        """Schedule one full redraw for when Tk is idle (coalesces requests)."""
+        self.canvas.draw_idle()
         
     def draw_blit(self):
         """Fast blit update using cached background.
@@ -743,8 +1042,8 @@ class PlotManager:
         properly without interfering with window manager operations.
         """
         if self._bg_cache is None:
-            # No background cached, do full draw
-            self.draw_full()
+            # Background invalidated by a resize - the pending redraw will
+            # recapture it, so skip this frame instead of drawing everything
             return
             
         # Restore background
@@ -752,22 +1051,14 @@ class PlotManager:
         
         # Draw all animated artists
         self.ax_dt.draw_artist(self.dt_line)
-        if hasattr(self, '_dt_expected_line'):
-            self.ax_dt.draw_artist(self._dt_expected_line)
-        for i, ln in enumerate(self.time_lines):
-            if self.channel_visible[i] and ln.get_visible():
-                self.ax_time.draw_artist(ln)
+        self.ax_time.draw_artist(self.time_lc)
         self.ax_sg.draw_artist(self.im_specgram)
         self.ax_wav.draw_artist(self.im_wavelet)
-        for i, ln in enumerate(self.psd_lines):
-            if self.channel_visible[i] and ln.get_visible():
-                self.ax_psd.draw_artist(ln)
-        for i, ln in enumerate(self.psd_max):
-            if ln.get_visible():  # Max-hold visibility already considers channel visibility
-                self.ax_psd.draw_artist(ln)
+        self.ax_psd.draw_artist(self.psd_lc)
+        self.ax_psd.draw_artist(self.maxhold_lc)
                 
-        # Single blit call for entire figure
-        self.canvas.blit(self.fig.bbox)
+        # Single blit call covering just the data axes
+        self.canvas.blit(self._blit_bbox)
         # REMOVED: self.canvas.flush_events() - This was causing window grab issues!
         # The animation loop already returns to Tkinter's event loop naturally
         # via self.after() scheduling, so forcing event processing here is
@@ -807,29 +1098,18 @@ class PlotManager:
             
         if 0 <= channel < 16:
             self.channel_visible[channel] = visible
+            self.display_rev += 1
             
             # Update line visibility immediately
-            if self.debug:
-                print(f"[PLOT_MANAGER] Setting time_lines[{channel}].set_visible({visible})")
-            self.time_lines[channel].set_visible(visible)
-            
-            if self.debug:
-                print(f"[PLOT_MANAGER] Setting psd_lines[{channel}].set_visible({visible})")
-            self.psd_lines[channel].set_visible(visible)
+            self._sync_time_visibility()
             
-            if not visible:
-                # If hiding channel, also hide its max-hold line
-                self.psd_max[channel].set_visible(False)
-            elif self.maxhold_enabled:
-                # If showing channel and max-hold is on, show max-hold line
-                self.psd_max[channel].set_visible(True)
+            self._sync_psd_visibility()  # max-hold follows its channel
             
             if self.debug:
                 print(f"[PLOT_MANAGER] Channel {channel} visibility updated to: {visible}")
-                print(f"[PLOT_MANAGER] Calling draw_full()")
             
-            # Force redraw to update display immediately
-            self.draw_full()
+            # Blit to update display immediately
+            self.draw_blit()  # only animated artists changed
             
     def set_all_channels_visibility(self, visible_list: list):
         """Set visibility for all channels at once (more efficient)."""
@@ -838,35 +1118,49 @@ class PlotManager:
             
         for i in range(16):
             self.channel_visible[i] = visible_list[i]
-            self.time_lines[i].set_visible(visible_list[i])
-            self.psd_lines[i].set_visible(visible_list[i])
-            if not visible_list[i]:
-                self.psd_max[i].set_visible(False)
-            elif self.maxhold_enabled:
-                self.psd_max[i].set_visible(True)
+        self.display_rev += 1
                 
-        # Single redraw for all changes
-        self.draw_full()
+        self._sync_time_visibility()
+        self._sync_psd_visibility()
+                
+        # Single blit for all changes
+        self.draw_blit()  # only animated artists changed
+    
+    def set_channel_mask(self, mask: int):
+        """Set all channels' visibility from a bitmask (bit i = channel i)."""
+        self.set_all_channels_visibility([bool(mask >> i & 1) for i in range(16)])
         
     def set_wavspec_channel(self, channel: int):
         """Set which channel to display in wavelet/spectrogram."""
         if 0 <= channel < 16:
             self.wavspec_channel = channel
+            self.display_rev += 1
             if self.debug:
                 print(f"[PLOT_MANAGER] Wavelet/Spectrogram channel set to: {channel}")
 
     def set_wavelet_limits(self, min_db: float, max_db: float):
         """Update wavelet plot limits."""
         self.wav_vmin, self.wav_vmax = min_db, max_db
-        self.im_wavelet.set_clim(min_db, max_db)
         if self.debug:
             print(f"[PLOT_MANAGER] Set wavelet limits: {min_db} to {max_db} dB")
-        self.draw_full()
+        self._requantize()
 
     def set_specgram_limits(self, min_db: float, max_db: float):
         """Update spectrogram plot limits."""
         self.spec_vmin, self.spec_vmax = min_db, max_db
-        self.im_specgram.set_clim(min_db, max_db)
         if self.debug:
             print(f"[PLOT_MANAGER] Set spectrogram limits: {min_db} to {max_db} dB")
-        self.draw_full()
\ No newline at end of file
+        self._requantize()
+    
+    def _requantize(self):
+        """
+        Re-queue the last snapshot with the current image limits.
+        
+        The images hold pre-quantised indices, so new limits need a new
+        frame; the DSP thread reuses its cached dB sections for it and
+        the next present_frame() shows the result.
+        """
+        if self._last_job is not None:
+            self._put_latest(self._anim_in_q, dict(
+                self._last_job, spec_clim=(self.spec_vmin, self.spec_vmax),
+                wav_clim=(self.wav_vmin, self.wav_vmax)))
\ No newline at end of file
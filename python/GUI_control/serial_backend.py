@@ -17,6 +17,8 @@ from typing import Optional, List
 import serial
 import serial.tools.list_ports
 
+from message_queue import MessageQueue
+
 
 class SerialManager:
     """
@@ -33,11 +35,15 @@ class SerialManager:
     RETRY_INTERVAL = 0.2      # Seconds between reconnection attempts
     READ_TIMEOUT = 0.1        # Serial read timeout (prevents blocking)
     DEFAULT_ACK_TIMEOUT = 1.0 # Default timeout for send_and_wait()
+    PORTS_TTL = 1.0           # ports() reuses a scan at most this old
+    
+    _ports_cache = (float("-inf"), [])  # (monotonic time, ports), see ports()
 
     def __init__(self):
         """Initialize queues and threading primitives."""
-        # Queue for data received from serial port (displayed in console)
-        self.rx_q = queue.Queue()
+        # Queue for data received from serial port (displayed in console);
+        # bounded and drop-oldest, so a chatty board cannot grow it forever
+        self.rx_q = MessageQueue()
         
         # Queue for data to be transmitted to serial port
         self.tx_q = queue.Queue()
@@ -169,15 +175,27 @@ class SerialManager:
             if delay > 0:
                 time.sleep(delay)
 
-    @staticmethod
-    def ports() -> List[str]:
+    @classmethod
+    def ports(cls, fresh: bool = False) -> List[str]:
         """
         Get list of available serial ports.
         
+        A full enumeration can take tens of ms (SetupAPI on Windows), so
+        background polls reuse a result younger than PORTS_TTL.
+        
+        Args:
+            fresh: Always enumerate (user-requested rescans and the
+                   reconnect check must see a port plugged in just now)
+        
         Returns:
             List of port names
         """
-        return [p.device for p in serial.tools.list_ports.comports()]
+        now = time.monotonic()
+        t, ports = cls._ports_cache
+        if fresh or now - t >= cls.PORTS_TTL:
+            ports = [p.device for p in serial.tools.list_ports.comports()]
+            cls._ports_cache = (now, ports)
+        return list(ports)
 
     def is_connected(self) -> bool:
         """Check if currently connected to serial port."""
@@ -203,8 +221,8 @@ class SerialManager:
                 self._is_connected = False
                 
                 # Check if port exists
-                if port not in self.ports():
-                    time.sleep(self.RETRY_INTERVAL)
+                if port not in self.ports(fresh=True):
+                    self._stop_evt.wait(self.RETRY_INTERVAL)
                     continue
                 
                 # Try to connect
@@ -232,7 +250,7 @@ class SerialManager:
                     
                 except Exception as e:
                     self.rx_q.put(f"[PC] ✖ Failed to open {port}: {e}\n")
-                    time.sleep(self.RETRY_INTERVAL)
+                    self._stop_evt.wait(self.RETRY_INTERVAL)
                     continue
 
             # ──────── Data Transfer ────────
@@ -279,7 +297,7 @@ class SerialManager:
                 except Exception:
                     pass
                 ser = None
-                time.sleep(self.RETRY_INTERVAL)
+                self._stop_evt.wait(self.RETRY_INTERVAL)
 
         # ──────── Cleanup ────────
         if ser and ser.is_open:
@@ -16,9 +16,20 @@ import multiprocessing as mp
 import socket
 import struct
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any
+from multiprocessing import shared_memory
+from typing import Optional, Dict, Any, Tuple
 import numpy as np
+import scipy.fft as spfft
+from scipy.signal import get_window
+
+from dsp_kernels import apply_window, decode_frames, mag_to_db, warmup as warmup_kernels
+
+try:
+    import pyfftw
+except ImportError:
+    pyfftw = None  # scipy.fft fallback
 
 
 # ────────────────────── Configuration ──────────────────────────
@@ -32,16 +43,22 @@ class SigConfig:
         sample_rate: Samples per second per channel (Hz)
         buf_secs: Buffer duration in seconds
         n_ch: Number of channels (fixed at 16 for ADS1299)
+        fft_pts: PSD length computed by the reader (0 = no PSD)
+        cheb_atten_db: Chebyshev window side-lobe attenuation for the PSD
     """
     sample_rate: int = 250
     buf_secs: int = 4
     n_ch: int = 16
+    fft_pts: int = 512
+    cheb_atten_db: float = 80.0
     
     def __post_init__(self):
         """Ensure all values are integers."""
         self.sample_rate = int(self.sample_rate)
         self.buf_secs = int(self.buf_secs)
         self.n_ch = int(self.n_ch)
+        self.fft_pts = int(self.fft_pts)
+        self.cheb_atten_db = float(self.cheb_atten_db)
     
     @property
     def buf_len(self) -> int:
@@ -85,12 +102,176 @@ def parse_frame(raw: bytes) -> np.ndarray:
     return vals
 
 
+# ────────────────────── PSD Engine ──────────────────────────────
+
+class PsdEngine:
+    """
+    Per-channel power spectrum (dB) of the newest NFFT samples.
+    
+    Uses a mean-normalised Chebyshev window. Windows and frequency axes
+    are cached (LRU) per parameter set and the windowed segments live in
+    a reusable float32 scratch buffer. The steps around the FFT run as
+    fused kernels from dsp_kernels (Numba when available), the FFT itself
+    through rfft() (persistent pyFFTW plans when available).
+    
+    Runs in the reader process (producer side) and, as a fallback, on
+    the GUI's plot DSP thread. One instance must not be shared between
+    threads.
+    """
+    
+    CACHE_SIZE = 8  # windows / frequency axes / FFT plans kept per cache
+    
+    def __init__(self):
+        self._win_cache = OrderedDict()   # (N, cheb_db) -> window
+        self._freq_cache = OrderedDict()  # (N, fs) -> rfftfreq bins
+        self._plan_cache = OrderedDict()  # (shape, dtype) -> pyFFTW plan
+        self._seg = np.empty((0, 0), dtype=np.float32)
+    
+    def _lru_get(self, cache, key, build):
+        """Return cache[key], building it with build() on a miss (LRU)."""
+        val = cache.get(key)
+        if val is None:
+            val = cache[key] = build()
+            if len(cache) > self.CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return val
+    
+    def window(self, n: int, cheb_db: float) -> np.ndarray:
+        """Mean-normalised float32 Chebyshev window, rebuilt only per
+        (n, cheb_db); float32 keeps the windowed data float32."""
+        def build():
+            try:
+                win = get_window(('chebwin', cheb_db), n, fftbins=False)
+            except Exception:
+                win = np.hamming(n)
+            # Normalize window by its mean
+            return (win / np.mean(win)).astype(np.float32)
+        return self._lru_get(self._win_cache, (n, round(cheb_db, 2)), build)
+    
+    def freqs(self, n: int, fs: float) -> np.ndarray:
+        """rfftfreq(n, 1/fs), rebuilt only per (n, fs)."""
+        return self._lru_get(self._freq_cache, (n, fs),
+                             lambda: np.fft.rfftfreq(n, d=1/fs))
+    
+    def rfft(self, x: np.ndarray) -> np.ndarray:
+        """
+        Real FFT of every row of 2-D *x*; x's contents may be destroyed.
+        
+        With pyFFTW, each (shape, dtype) gets one FFTW_MEASURE plan that
+        is reused until evicted; the result is then the plan's output
+        buffer, valid only until the next call with that shape.
+        Otherwise scipy.fft. Both run single-threaded, like the pyFFTW
+        plans: a 16 × nfft transform is too small to gain from threads.
+        """
+        if pyfftw is None:
+            return spfft.rfft(x, axis=1, overwrite_x=True)
+        plan = self._lru_get(
+            self._plan_cache, (x.shape, x.dtype.str),
+            lambda: pyfftw.builders.rfft(
+                pyfftw.empty_aligned(x.shape, dtype=x.dtype), axis=1,
+                planner_effort='FFTW_MEASURE', threads=1))
+        return plan(x)
+    
+    def compute(self, data: np.ndarray, fs: float, nfft: int,
+                cheb_db: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        PSD of the last *nfft* samples of *data*.
+        
+        Args:
+            data: (channels, samples) array, samples >= nfft
+            fs: Sample rate (Hz)
+            nfft: FFT length
+            cheb_db: Chebyshev attenuation (dB)
+            
+        Returns:
+            (psd, freqs): psd is (channels, nfft//2 + 1) float32 in dB
+        """
+        win = self.window(nfft, cheb_db)
+        
+        n_ch = data.shape[0]
+        
+        # float32 (channels, nfft) scratch, reused across calls
+        if self._seg.shape != (n_ch, nfft):
+            self._seg = np.empty((n_ch, nfft), dtype=np.float32)
+        seg = self._seg
+        
+        # Windowed segments without removing DC (keep original signal);
+        # one rFFT along the rows covers all channels
+        apply_window(data[:, -nfft:], win, seg)
+        spec = self.rfft(seg)
+        
+        # |X| / nfft → dB in a single pass
+        psd = np.empty((n_ch, nfft // 2 + 1), dtype=np.float32)
+        mag_to_db(spec, 1.0 / nfft, psd)
+        return psd, self.freqs(nfft, fs)
+
+
 # ── ADS1299 Scaling Factor ────────────────────────────────────
 # Full scale range: ±4.5V, 24-bit signed ADC
 # LSB = 4.5V / 2^23 = 0.536 µV
 SCALE = 4.5 / (2**23)
 
 
+# ────────────────────── Shared Sample Ring ─────────────────────
+
+class SharedRing:
+    """
+    Circular sample buffer in a multiprocessing.shared_memory block.
+    
+    Layout: an int64 header [seq, ptr, n_ch, length], the (n_ch, length)
+    float32 samples in volts (channel-major) and the (length,) uint32
+    timestamps. The reader process writes samples in place and moves
+    ptr/seq under the worker lock; the GUI copies the ring out in order
+    under the same lock, so nothing is pickled per update.
+    
+    The SignalWorker creates (and unlinks) the blocks, the reader only
+    attaches to them by name.
+    """
+    
+    HEADER = 4  # int64 fields
+    
+    def __init__(self, name: Optional[str] = None, n_ch: int = 16, length: int = 1):
+        """Attach to block *name*, or create a new (n_ch, length) one."""
+        if name is None:
+            size = 8 * self.HEADER + 4 * (n_ch + 1) * length
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            np.ndarray((self.HEADER,), np.int64, self.shm.buf)[:] = (0, 0, n_ch, length)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.hdr = np.ndarray((self.HEADER,), np.int64, self.shm.buf)
+        n_ch, length = int(self.hdr[2]), int(self.hdr[3])
+        offset = 8 * self.HEADER
+        self.data = np.ndarray((n_ch, length), np.float32, self.shm.buf, offset)
+        self.time = np.ndarray((length,), np.uint32, self.shm.buf,
+                               offset + 4 * n_ch * length)
+    
+    @property
+    def name(self) -> str:
+        return self.shm.name
+    
+    @property
+    def length(self) -> int:
+        return self.time.shape[0]
+    
+    def ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Copy out (data, time) ordered [oldest...newest]."""
+        ptr = int(self.hdr[1])
+        tail = self.length - ptr
+        data = np.empty_like(self.data)
+        data[:, :tail] = self.data[:, ptr:]
+        data[:, tail:] = self.data[:, :ptr]
+        return data, np.roll(self.time, -ptr)
+    
+    def close(self, unlink: bool = False):
+        """Drop the views and detach (and remove the block if *unlink*)."""
+        self.hdr = self.data = self.time = None  # exported buffers block close()
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
 # ────────────────────── UDP Reader Process ─────────────────────
 
 class _Reader(mp.Process):
@@ -98,11 +279,11 @@ class _Reader(mp.Process):
     Background process for high-speed UDP data reception.
     
     Features:
-    - Circular buffer with zero-copy updates
+    - Circular buffer in shared memory, written in place (SharedRing)
     - Batch processing of multiple packets
     - Dynamic buffer resizing
     - Performance statistics
-    - Optimized buffer reordering using np.roll()
+    - Packet decoding straight into the ring (dsp_kernels.decode_frames)
     """
     
     # Protocol constants
@@ -110,17 +291,19 @@ class _Reader(mp.Process):
     MAX_PACKET = 4096       # Maximum UDP packet size
     MAX_PACKETS_PER_CYCLE = 10  # Process up to 10 packets at once
     RESIZE_CHECK_INTERVAL = 100  # Check buffer resize every N frames
+    PSD_INTERVAL = 1 / 30   # Publish a fresh PSD at most this often (s)
     SOCKET_TIMEOUT = 0.010  # 10ms blocking timeout
     STATS_INTERVAL = 1.0    # Print performance stats every second
     
-    def __init__(self, cfg_ns, shared, lock, port, ip="0.0.0.0"):
+    def __init__(self, cfg_ns, shared, lock, data_ready, port, ip="0.0.0.0"):
         """
         Initialize reader process.
         
         Args:
             cfg_ns: Multiprocessing namespace with configuration
-            shared: Shared dictionary for data exchange
-            lock: Lock for shared memory access
+            shared: Shared dictionary for the small per-update values
+            lock: Lock for the sample ring (see SharedRing)
+            data_ready: Event set after every shared-memory update
             port: UDP port to listen on (default 5001)
             ip: IP to bind to (0.0.0.0 = all interfaces)
         """
@@ -128,6 +311,7 @@ class _Reader(mp.Process):
         self.cfg = cfg_ns
         self.shared = shared
         self.lock = lock
+        self.data_ready = data_ready
         self.port = port
         self.ip = ip
         
@@ -140,18 +324,31 @@ class _Reader(mp.Process):
         
         # Pre-allocate receive buffer to avoid allocations
         recv_buf = bytearray(self.MAX_PACKET)
+        recv_raw = np.frombuffer(recv_buf, dtype=np.uint8)  # same memory, for decode_frames
         
-        # Initialize circular buffers
-        current_buf_len = self.cfg.buf_len
-        buf_raw = np.zeros((current_buf_len, self.cfg.n_ch), np.int32)
-        buf_time = np.zeros(current_buf_len, np.uint32)
+        # Circular buffer - the shared ring the SignalWorker created for us.
+        # Channel-major (n_ch, samples), so per-channel reads are contiguous
+        # rows, not strided columns
+        ring = SharedRing(self.cfg.ring_name)
+        buf_data, buf_time = ring.data, ring.time
+        current_buf_len = ring.length
         
         # Circular buffer write pointer (next write position)
         ptr = 0
         
+        # Publish counter - bumped on every shared-memory update so readers
+        # can tell a fresh snapshot from one they have already drawn
+        seq = 0
+        
         # Cache frequently accessed values
-        n_ch = self.cfg.n_ch
         pause_reception = False
+        published_ring = None
+        last_batt = None
+        
+        # Producer-side PSD: the GUI only has to draw it
+        warmup_kernels()
+        psd_engine = PsdEngine()
+        next_psd_time = 0.0
         
         # Performance monitoring
         last_stat_time = time.perf_counter()
@@ -163,35 +360,39 @@ class _Reader(mp.Process):
         while True:
             # ─────── Periodic Tasks (every N frames) ───────
             if frames_processed % self.RESIZE_CHECK_INTERVAL == 0:
-                # Check if buffer needs resizing
-                expected_buf_len = self.cfg.sample_rate * self.cfg.buf_secs
-                if expected_buf_len != current_buf_len:
+                # Check if buffer needs resizing: update_cfg() hands us a
+                # new ring of the new size
+                ring_name = self.cfg.ring_name
+                new_ring = None
+                if ring_name != ring.name:
+                    try:
+                        new_ring = SharedRing(ring_name)
+                    except FileNotFoundError:
+                        pass  # already superseded by a newer ring - next check
+                if new_ring is not None:
+                    expected_buf_len = new_ring.length
                     # Buffer size changed - resize
                     print(f"[SIGNAL_BACKEND] Buffer resize: {current_buf_len} -> {expected_buf_len}")
                     
-                    # Create new buffers
-                    new_buf_raw = np.zeros((expected_buf_len, n_ch), np.int32)
-                    new_buf_time = np.zeros(expected_buf_len, np.uint32)
-                    
-                    # Preserve existing data if any
-                    if ptr > 0:
-                        # OPTIMIZED: Use np.roll for efficient reordering
-                        old_ordered_raw = np.roll(buf_raw, -ptr, axis=0)
-                        old_ordered_time = np.roll(buf_time, -ptr)
-                        
-                        copy_len = min(current_buf_len, expected_buf_len)
-                        if current_buf_len > expected_buf_len:
-                            # Buffer shrinking: keep most recent data
-                            new_buf_raw[:] = old_ordered_raw[-copy_len:]
-                            new_buf_time[:] = old_ordered_time[-copy_len:]
-                        else:
-                            # Buffer growing: put old data at end
-                            new_buf_raw[-copy_len:] = old_ordered_raw[:copy_len]
-                            new_buf_time[-copy_len:] = old_ordered_time[:copy_len]
+                    # Preserve the newest samples, copied straight from the
+                    # old ring into the end of the new one (no reordered
+                    # temporaries): first the part before ptr, then the
+                    # part wrapped around the old ring's end
+                    n = min(current_buf_len, expected_buf_len)
+                    k = min(n, ptr)
+                    new_ring.data[:, expected_buf_len - k:] = buf_data[:, ptr - k:ptr]
+                    new_ring.time[expected_buf_len - k:] = buf_time[ptr - k:ptr]
+                    if n > k:
+                        wrap = slice(current_buf_len - (n - k), current_buf_len)
+                        dst = slice(expected_buf_len - n, expected_buf_len - k)
+                        new_ring.data[:, dst] = buf_data[:, wrap]
+                        new_ring.time[dst] = buf_time[wrap]
                     
                     # Switch to new buffers
-                    buf_raw = new_buf_raw
-                    buf_time = new_buf_time
+                    del buf_data, buf_time
+                    ring.close()
+                    ring = new_ring
+                    buf_data, buf_time = ring.data, ring.time
                     current_buf_len = expected_buf_len
                     ptr = 0  # Reset pointer after resize
                 
@@ -227,17 +428,14 @@ class _Reader(mp.Process):
                     # Extract battery voltage (last 4 bytes of packet)
                     batt = struct.unpack_from('<f', recv_buf, frames * self.FRAMESIZE)[0]
                     
-                    # Process each frame in the packet
-                    for n in range(frames):
-                        base = n * self.FRAMESIZE
-                        
-                        # Parse 24-bit samples using OPTIMIZED vectorized function
-                        buf_raw[ptr] = parse_frame(recv_buf[base:base + 48])
-                        # Timestamp is in units of 8 microseconds (hardware specific)
-                        buf_time[ptr] = struct.unpack_from('<I', recv_buf, base + 48)[0]
-                        
-                        # Advance circular buffer pointer
-                        ptr = (ptr + 1) % current_buf_len
+                    # Decode all frames of the packet straight into the ring
+                    # (24-bit samples × SCALE, timestamps in units of 8 µs)
+                    # in one kernel call. The GUI copies the ring under the
+                    # lock, so it never sees samples ahead of ptr
+                    with self.lock:
+                        ptr = decode_frames(recv_raw, frames, self.FRAMESIZE, SCALE,
+                                            buf_data, buf_time, ptr)
+                        ring.hdr[1] = ptr
                         
                 except socket.timeout:
                     # Normal - no more packets available
@@ -255,12 +453,38 @@ class _Reader(mp.Process):
             
             # ─────── Update Shared Memory ───────
             if frames_this_cycle > 0:
-                with self.lock:
-                    # OPTIMIZED: Use np.roll for efficient circular buffer reordering
-                    # Convert from circular [newest...ptr...oldest] to linear [oldest...newest]
-                    self.shared["data"] = np.roll(buf_raw, -ptr, axis=0) * SCALE
-                    self.shared["time"] = np.roll(buf_time, -ptr)
-                    self.shared["batt_v"] = batt
+                # The samples are already in the ring; publishing is just
+                # bumping seq. The dict (one IPC round trip per write) only
+                # gets the values that changed
+                seq += 1
+                ring.hdr[0] = seq
+                if ring.name != published_ring:
+                    self.shared["ring"] = published_ring = ring.name
+                if batt != last_batt:
+                    self.shared["batt_v"] = last_batt = batt
+                
+                # PSD of the newest fft_pts samples, throttled to PSD_INTERVAL
+                # (a view of the ring unless they wrap around its end). Its
+                # settings are re-read on the same clock and published with
+                # it, so the GUI can tell a PSD made with stale ones
+                now = time.perf_counter()
+                if now >= next_psd_time:
+                    fft_pts = int(self.cfg.fft_pts)
+                    cheb_atten_db = float(self.cfg.cheb_atten_db)
+                    sample_rate = int(self.cfg.sample_rate)
+                    if 0 < fft_pts <= current_buf_len:
+                        if ptr >= fft_pts:
+                            newest = buf_data[:, ptr - fft_pts:ptr]
+                        else:
+                            newest = np.concatenate(
+                                (buf_data[:, ptr - fft_pts:], buf_data[:, :ptr]), axis=1)
+                        psd, psd_freqs = psd_engine.compute(
+                            newest, sample_rate, fft_pts, cheb_atten_db)
+                        self.shared.update(
+                            psd=psd, psd_freqs=psd_freqs,
+                            psd_key=(fft_pts, cheb_atten_db, sample_rate))
+                    next_psd_time = now + self.PSD_INTERVAL
+                self.data_ready.set()
                 
                 # Update statistics
                 packets_processed += packets_this_cycle
@@ -286,7 +510,9 @@ class SignalWorker:
     High-level interface for signal acquisition.
     
     Manages a background process that receives UDP data and provides
-    thread-safe access to the latest samples.
+    thread-safe access to the latest samples. The samples live in a
+    SharedRing owned by this object; the reader process writes them in
+    place and snapshot() copies them out.
     
     Example:
         cfg = SigConfig(sample_rate=500, buf_secs=10)
@@ -296,7 +522,7 @@ class SignalWorker:
         # Get latest data
         snapshot = worker.snapshot()
         if snapshot:
-            data = snapshot['data']    # (samples, 16) float array in volts
+            data = snapshot['data']    # (16, samples) float32 array in volts
             time = snapshot['time']    # Sample timestamps
             batt = snapshot['batt_v']  # Battery voltage
     """
@@ -306,21 +532,36 @@ class SignalWorker:
         Initialize signal worker.
         
         Args:
-            cfg: Signal configuration
+            cfg: Signal configuration; kept in sync by update_cfg(), so the
+                 caller can read it without touching the shared namespace
             data_port: UDP port for data reception (default 5001)
         """
+        self.local_cfg = cfg
+        
         # Multiprocessing setup
         self._mgr = mp.Manager()
         self._shared = self._mgr.dict()
         self._lock = mp.Lock()
         
+        # Sample rings by name: the one the reader publishes plus, after a
+        # resize, the new one it has not switched to yet
+        self._rings: Dict[str, SharedRing] = {}
+        self._ring = self._new_ring(cfg.n_ch, cfg.buf_len)
+        
+        # Set by the reader whenever new samples are published; consumers
+        # clear() it before snapshot() and can skip the (IPC) snapshot
+        # entirely while it stays clear
+        self.data_ready = mp.Event()
+        
         # Configuration in shared namespace
         self.cfg = self._mgr.Namespace(**asdict(cfg))
         self.cfg.buf_len = cfg.buf_len
         self.cfg.pause_reception = False
+        self.cfg.ring_name = self._ring.name
         
         # Create reader process
-        self._proc = _Reader(self.cfg, self._shared, self._lock, data_port)
+        self._proc = _Reader(self.cfg, self._shared, self._lock,
+                             self.data_ready, data_port)
         
     def start(self):
         """Start the background reader process."""
@@ -329,7 +570,7 @@ class SignalWorker:
             print(f"[SIGNAL_BACKEND] Started reader process (PID: {self._proc.pid})")
             
     def stop(self):
-        """Stop the background reader process."""
+        """Stop the background reader process and free the sample rings."""
         if self._proc.is_alive():
             self._proc.terminate()
             self._proc.join(timeout=1.0)
@@ -337,6 +578,14 @@ class SignalWorker:
                 print("[SIGNAL_BACKEND] Warning: Reader process didn't stop cleanly")
             else:
                 print("[SIGNAL_BACKEND] Reader process stopped")
+        for name in list(self._rings):
+            self._rings.pop(name).close(unlink=True)
+    
+    def _new_ring(self, n_ch: int, length: int) -> SharedRing:
+        """Create a ring of *length* samples and keep it until retired."""
+        ring = SharedRing(n_ch=n_ch, length=length)
+        self._rings[ring.name] = ring
+        return ring
             
     def snapshot(self) -> Optional[Dict[str, Any]]:
         """
@@ -344,18 +593,29 @@ class SignalWorker:
         
         Returns:
             Dictionary with keys:
-            - 'data': (samples, 16) array of voltages
+            - 'data': (16, samples) float32 array of voltages (channel-major)
             - 'time': (samples,) array of timestamps
             - 'batt_v': Battery voltage
+            - 'seq': Publish counter, increases whenever new samples arrive
+            - 'psd': (16, fft_pts//2 + 1) PSD in dB of the newest samples
+            - 'psd_freqs': Frequency bins for 'psd'
+            - 'psd_key': (fft_pts, cheb_atten_db, sample_rate) 'psd' was
+              computed with
             
             Returns None if no data available yet.
         """
+        snap = self._shared.copy()  # one IPC round trip for the small values
+        ring = self._rings.get(snap.pop("ring", None))
+        if ring is None:
+            return None
+        if len(self._rings) > 1:
+            # Retire every ring the reader has moved past and will not use
+            for name in [n for n in self._rings if n not in (ring.name, self._ring.name)]:
+                self._rings.pop(name).close(unlink=True)
         with self._lock:
-            if "data" not in self._shared:
-                return None
-            # Return copies to prevent modification
-            return {k: v.copy() if hasattr(v, "copy") else v
-                    for k, v in self._shared.items()}
+            snap["data"], snap["time"] = ring.ordered()
+            snap["seq"] = int(ring.hdr[0])
+        return snap
                     
     def update_cfg(self, **kwargs):
         """
@@ -364,17 +624,31 @@ class SignalWorker:
         Args:
             sample_rate: New sample rate (Hz)
             buf_secs: New buffer duration (seconds)
+            fft_pts: PSD length
+            cheb_atten_db: PSD window attenuation (dB)
             
         The buffer will be resized on the next processing cycle.
+        
+        Both the local SigConfig and the shared namespace are updated;
+        only values that actually changed are sent to the namespace (each
+        write is an IPC round trip to the manager process).
         """
-        for k, v in kwargs.items():
+        local = self.local_cfg
+        changed = {k: v for k, v in kwargs.items() if getattr(local, k, None) != v}
+        for k, v in changed.items():
+            setattr(local, k, v)
             setattr(self.cfg, k, v)
         
         # Update derived property
-        if 'sample_rate' in kwargs or 'buf_secs' in kwargs:
-            self.cfg.buf_len = self.cfg.sample_rate * self.cfg.buf_secs
-            print(f"[SIGNAL_BACKEND] Config updated: {self.cfg.sample_rate}Hz, "
-                  f"{self.cfg.buf_secs}s buffer ({self.cfg.buf_len} samples)")
+        if 'sample_rate' in changed or 'buf_secs' in changed:
+            buf_len = local.buf_len
+            self.cfg.buf_len = buf_len
+            if buf_len != self._ring.length:
+                # The reader copies the recent samples across and switches
+                self._ring = self._new_ring(local.n_ch, buf_len)
+                self.cfg.ring_name = self._ring.name
+            print(f"[SIGNAL_BACKEND] Config updated: {local.sample_rate}Hz, "
+                  f"{local.buf_secs}s buffer ({buf_len} samples)")
             
     @property
     def pause_reception(self) -> bool:
@@ -15,8 +15,11 @@ import socket
 import threading
 import queue
 import time
+from collections import deque
 from typing import Optional, Callable
 
+from message_queue import MessageQueue
+
 
 class UDPManager:
     """
@@ -36,21 +39,30 @@ class UDPManager:
     SOCKET_TIMEOUT = 0.050  # 50ms - balance between CPU and responsiveness
     RECV_BUFFER_SIZE = 512  # Max size for control messages
     MAX_TX_PER_CYCLE = 20   # Process up to N TX messages per loop
+    ENC_CACHE_SIZE = 256    # Distinct encoded commands kept by send()
     
-    def __init__(self, ctrl_port: int):
+    def __init__(self, ctrl_port: int, rx_q: Optional[MessageQueue] = None):
         """
         Initialize UDP manager.
         
         Args:
             ctrl_port: UDP port to listen on (typically 5000)
+            rx_q: Queue for received/status messages, e.g. one shared with
+                  the GUI console (default: a private MessageQueue)
         """
         # Network configuration
         self.ctrl_port = ctrl_port
         self.board_ip: Optional[str] = None  # Discovered from first packet
         
         # Communication queues
-        self.rx_q = queue.Queue()  # Received messages for GUI display
-        self.tx_q = queue.Queue()  # Messages to transmit
+        # Received messages for GUI display (bounded, drops oldest)
+        self.rx_q = rx_q if rx_q is not None else MessageQueue()
+        # Messages to transmit - single producer (GUI) / single consumer
+        # (worker), so a plain deque is enough: append/popleft are atomic
+        self.tx_q = deque()
+        # Command text -> encoded packet; the GUI repeats a small set of
+        # button commands, so each is encoded only once
+        self._enc_cache: dict[str, bytes] = {}
         
         # Optional callback for transmitted messages (GUI echo)
         self.tx_hook: Optional[Callable[[str], None]] = None
@@ -109,11 +121,13 @@ class UDPManager:
             
         Note: Commands are only sent after board IP is discovered.
         """
-        # Clean up the command
-        line = text.rstrip()
-        
-        # Encode and add protocol newline
-        self.tx_q.put(line.encode('ascii', errors='ignore') + b"\n")
+        pkt = self._enc_cache.get(text)
+        if pkt is None:
+            # Clean up the command, encode and add protocol newline
+            pkt = text.rstrip().encode('ascii', errors='ignore') + b"\n"
+            if len(self._enc_cache) < self.ENC_CACHE_SIZE:
+                self._enc_cache[text] = pkt
+        self.tx_q.append(pkt)
 
     def is_connected(self) -> bool:
         """Check if connected to a board (IP discovered)."""
@@ -145,6 +159,9 @@ class UDPManager:
         # Initialize keep-alive timer
         next_WOOF_WOOF = time.time() + self.WOOF_WOOF_INTERVAL
         
+        # Board address tuple, rebuilt only when board_ip changes
+        dest = None
+        
         # Log startup
         self.rx_q.put(f"[PC] UDP listening on *:{self.ctrl_port}\n")
 
@@ -191,10 +208,12 @@ class UDPManager:
             tx_count = 0
             while tx_count < self.MAX_TX_PER_CYCLE:
                 try:
-                    pkt = self.tx_q.get_nowait()
+                    pkt = self.tx_q.popleft()
                     
                     # Only send if we know the board's IP
                     if self.board_ip:
+                        if dest is None or dest[0] != self.board_ip:
+                            dest = (self.board_ip, self.ctrl_port)
                         # Optional echo callback for GUI
                         if self.tx_hook:
                             try:
@@ -204,14 +223,14 @@ class UDPManager:
                                 pass  # Don't let callback errors stop transmission
                         
                         # Send to board
-                        sock.sendto(pkt, (self.board_ip, self.ctrl_port))
+                        sock.sendto(pkt, dest)
                         tx_count += 1
                     else:
-                        # No board IP yet - put message back
-                        self.tx_q.put(pkt)
+                        # No board IP yet - put message back at the front
+                        self.tx_q.appendleft(pkt)
                         break
                         
-                except queue.Empty:
+                except IndexError:
                     break  # No more messages to send
                 except socket.error as e:
                     self.rx_q.put(f"[PC] Failed to send: {e}\n")
@@ -262,9 +281,11 @@ Example usage in GUI:
         print(f"Connected to board at {udp.board_ip}")
     
     # Process received messages
-    while not udp.rx_q.empty():
-        msg = udp.rx_q.get()
-        console.insert("end", msg)
+    try:
+        while True:
+            console.insert("end", udp.rx_q.get_nowait())
+    except queue.Empty:
+        pass
     
     # Stop when done
     udp.stop()